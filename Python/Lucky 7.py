@@ -361,17 +361,35 @@ if __name__ == "__main__":
     main()
 
 '''
+import os
 import random
 
+from lucky7_events import EventLog
+from lucky7_leaderboard import Leaderboard
+from lucky7_otp import OTPService, OTPThrottled
+from lucky7_settlement import BETS, settle
+from lucky7_store import UserStore
+
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Users and their stats are kept in lucky7.db next to this file
+# (set LUCKY7_DB to use another file, e.g. for load tests)
+store = UserStore(os.environ.get("LUCKY7_DB", os.path.join(GAME_DIR, "lucky7.db")))
+
+# Every settled bet is also appended to a binary event log, so stats can be
+# rebuilt (or re-settled after a rule change) with lucky7_events.rebuild_stats()
+events = EventLog(os.environ.get("LUCKY7_EVENTS", os.path.join(GAME_DIR, "lucky7.events")))
+
 # Nested dictionary to store user data
-users = {}
+users = store.load_users()
 
-# ---------------------- FUNCTIONS ----------------------
+# Players ranked by score
+leaderboard = Leaderboard(users)
 
-def generate_otp():
-    """Generate a 4-digit OTP"""
-    return str(random.randint(1000, 9999))
+# Expiring, rate-limited login codes
+otps = OTPService()
 
+# ---------------------- FUNCTIONS ----------------------
 
 def signup():
     username = input("Enter Username: ")
@@ -381,6 +399,16 @@ def signup():
         return None
 
     name = input("Enter Your Name: ")
+    create_user(username, name)
+
+    print("Signup Successful!")
+    return username
+
+
+def create_user(username, name):
+    """Add a new user with zero stats; return False if the username is taken."""
+    if username in users:
+        return False
 
     # Creating nested dictionary for user
     users[username] = {
@@ -389,9 +417,9 @@ def signup():
         "losses": 0,
         "score": 0
     }
-
-    print("Signup Successful!")
-    return username
+    store.add_user(username, name)
+    leaderboard.update(username, 0)
+    return True
 
 
 def login():
@@ -401,12 +429,16 @@ def login():
         print("User not found. Please signup first.")
         return None
 
-    otp = generate_otp()
+    try:
+        otp = otps.issue(username)
+    except OTPThrottled as error:
+        print(f"Too many OTP requests. Try again in {error.retry_after:.0f} seconds.")
+        return None
     print("Generated OTP:", otp)
 
     entered_otp = input("Enter OTP: ")
 
-    if entered_otp == otp:
+    if otps.verify(username, entered_otp):
         print("Login Successful!")
         return username
     else:
@@ -420,12 +452,34 @@ def roll_dice():
     return die1, die2
 
 
+def process_bet(bet, total, username):
+    """
+    Settle one bet, update the user's stats and their leaderboard position.
+    Returns the points won (positive) or lost (negative).
+    """
+    # One lookup in the payout table instead of an if/elif per bet type
+    points = settle(bet, total)
+
+    if points > 0:
+        users[username]["wins"] += 1
+    else:
+        users[username]["losses"] += 1
+    users[username]["score"] += points
+
+    # Save the new stats (written to disk in batches)
+    store.save_stats(username, users[username])
+
+    # Move the player on the leaderboard - O(log n), no full sort
+    leaderboard.update(username, users[username]["score"])
+    return points
+
+
 def play_game(username):
 
     while True:
 
         print("\n------ Lucky 7 Game ------")
-        print("Bet Options: +7  |  -7  |  ==7")
+        print("Bet Options: " + "  |  ".join(BETS))
         print("Type 'exit' to logout")
 
         bet = input("Enter your bet: ")
@@ -434,7 +488,7 @@ def play_game(username):
             print("Logging out...")
             break
 
-        if bet not in ["+7", "-7", "==7"]:
+        if bet not in BETS:
             print("Invalid Bet! Try again.")
             continue
 
@@ -444,40 +498,17 @@ def play_game(username):
         print(f"Dice Rolled: {die1} and {die2}")
         print("Total:", total)
 
-        # Conditional Statements
+        points = process_bet(bet, total, username)
+        events.append(username, bet, die1, die2, points)
 
-        if bet == "+7":
-            if total > 7:
-                print("You Won! +10 Points")
-                users[username]["wins"] += 1
-                users[username]["score"] += 10
-            else:
-                print("You Lost! -5 Points")
-                users[username]["losses"] += 1
-                users[username]["score"] -= 5
-
-        elif bet == "-7":
-            if total < 7:
-                print("You Won! +10 Points")
-                users[username]["wins"] += 1
-                users[username]["score"] += 10
-            else:
-                print("You Lost! -5 Points")
-                users[username]["losses"] += 1
-                users[username]["score"] -= 5
-
-        elif bet == "==7":
-            if total == 7:
-                print("You Won! +20 Points")
-                users[username]["wins"] += 1
-                users[username]["score"] += 20
-            else:
-                print("You Lost! -5 Points")
-                users[username]["losses"] += 1
-                users[username]["score"] -= 5
+        if points > 0:
+            print(f"You Won! +{points} Points")
+        else:
+            print(f"You Lost! {points} Points")
 
         # Display Updated Data
         print("\nUpdated User Data:", users[username])
+        print(f"Leaderboard Rank: {leaderboard.rank(username)} of {len(leaderboard)}")
 
         choice = input("\nPress any key to play again | Press 0 to stop game: ")
 
@@ -485,31 +516,40 @@ def play_game(username):
             print("Game Stopped.")
             break
 
+    events.flush()
+
 
 # ---------------------- MAIN PROGRAM ----------------------
 
-while True:
+def main():
+    while True:
 
-    print("\n===== Welcome to Lucky 7 Application =====")
-    print("1. Signup")
-    print("2. Login")
-    print("3. Exit")
+        print("\n===== Welcome to Lucky 7 Application =====")
+        print("1. Signup")
+        print("2. Login")
+        print("3. Exit")
+
+        option = input("Choose an option: ")
+
+        if option == "1":
+            user = signup()
+            if user:
+                play_game(user)
 
-    option = input("Choose an option: ")
+        elif option == "2":
+            user = login()
+            if user:
+                play_game(user)
 
-    if option == "1":
-        user = signup()
-        if user:
-            play_game(user)
+        elif option == "3":
+            print("Exiting Application...")
+            store.close()
+            events.close()
+            break
 
-    elif option == "2":
-        user = login()
-        if user:
-            play_game(user)
+        else:
+            print("Invalid Choice! Try Again.")
 
-    elif option == "3":
-        print("Exiting Application...")
-        break
 
-    else:
-        print("Invalid Choice! Try Again.")
+if __name__ == "__main__":
+    main()
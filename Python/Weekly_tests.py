@@ -324,13 +324,14 @@ class BankAccount:
         print("Current Balance:", self.balance)
 
 
-acc = BankAccount("Ravi", 5000)
+if __name__ == "__main__":
+    acc = BankAccount("Ravi", 5000)
 
-acc.display_balance()
-acc.deposit(2000)
-acc.display_balance()
-acc.withdraw(8000)
-acc.display_balance()
+    acc.display_balance()
+    acc.deposit(2000)
+    acc.display_balance()
+    acc.withdraw(8000)
+    acc.display_balance()
 
 
 # 2). ATM Withdrawal System
@@ -338,23 +339,24 @@ class InsufficientBalanceError(Exception):
     pass
 
 
-balance = 5000
+if __name__ == "__main__":
+    balance = 5000
 
-try:
-    amount = int(input("Enter withdrawal amount: "))
+    try:
+        amount = int(input("Enter withdrawal amount: "))
 
-    if amount > balance:
-        raise InsufficientBalanceError("Insufficient Balance")
+        if amount > balance:
+            raise InsufficientBalanceError("Insufficient Balance")
 
-    balance = balance - amount
-    print("Withdrawal successful")
-    print("Remaining balance:", balance)
+        balance = balance - amount
+        print("Withdrawal successful")
+        print("Remaining balance:", balance)
 
-except InsufficientBalanceError as e:
-    print("Error:", e)
+    except InsufficientBalanceError as e:
+        print("Error:", e)
 
-except ValueError:
-    print("Invalid input")
+    except ValueError:
+        print("Invalid input")
 
 
 # 3). ATM Machine System
@@ -396,9 +398,10 @@ class BankATM(ATM):
         print("Current Balance:", self.balance)
 
 
-atm = BankATM(5000)
+if __name__ == "__main__":
+    atm = BankATM(5000)
 
-atm.check_balance()
-atm.deposit(2000)
-atm.withdraw(3000)
-atm.check_balance()
\ No newline at end of file
+    atm.check_balance()
+    atm.deposit(2000)
+    atm.withdraw(3000)
+    atm.check_balance()
\ No newline at end of file
@@ -0,0 +1,318 @@
+"""
+=============================================================================
+ATM ENGINE (thread-safe, many accounts)
+=============================================================================
+Library version of the dictionary ATM in Feb_11.py: no input()/print(),
+any number of accounts, and safe to call from many threads at once.
+
+  * Every account has its own lock, so sessions on different accounts
+    never wait for each other; only operations on the SAME account are
+    serialised.  Transfers take both locks in account-number order, so two
+    opposite transfers can never deadlock.
+  * Each account keeps its last HISTORY_SIZE transactions in a
+    deque(maxlen=...), so memory per account stays fixed however long the
+    engine runs.
+  * Like Feb_11.py, three wrong PINs lock the account.
+
+    engine = ATMEngine(DEMO_ACCOUNTS)
+    session = engine.login("667755441", 1234)
+    session.withdraw(500)
+    print(session.mini_statement())
+
+Run the file to hammer the engine from many threads and check that money
+is conserved (stress_test()).
+=============================================================================
+"""
+
+import random
+import threading
+import time
+from collections import deque
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+HISTORY_SIZE = 20           # transactions remembered per account
+STATEMENT_SIZE = 5          # shown in a mini statement (as in Feb_11.py)
+MAX_PIN_ATTEMPTS = 3
+
+# Same sample data as Feb_11.py
+DEMO_ACCOUNTS = {
+    "667755441": {"Name": "Alex", "Balance": 3000, "Pin": 1234},
+    "667755442": {"Name": "Bob", "Balance": 10000, "Pin": 4321},
+    "667755443": {"Name": "Charles", "Balance": 30000, "Pin": 1212},
+    "667755444": {"Name": "David", "Balance": 5000, "Pin": 1313},
+}
+
+
+class ATMError(Exception):
+    """Base class for ATM errors."""
+
+
+class UnknownAccountError(ATMError):
+    pass
+
+
+class AccountLockedError(ATMError):
+    pass
+
+
+class InvalidPinError(ATMError):
+    pass
+
+
+class InsufficientBalanceError(ATMError):
+    pass
+
+
+# =============================================================================
+# ACCOUNT
+# =============================================================================
+
+class Account:
+    """One account; every field is guarded by self.lock."""
+
+    __slots__ = ("number", "name", "balance", "pin", "failed_pins",
+                 "locked", "history", "lock")
+
+    def __init__(self, number: str, name: str, balance: int, pin: int,
+                 history_size: int = HISTORY_SIZE):
+        self.number = number
+        self.name = name
+        self.balance = balance
+        self.pin = pin
+        self.failed_pins = 0
+        self.locked = False
+        self.history = deque(maxlen=history_size)     # (kind, amount, balance after)
+        self.lock = threading.Lock()
+
+
+# =============================================================================
+# ENGINE
+# =============================================================================
+
+class ATMEngine:
+    """All accounts plus the operations on them."""
+
+    def __init__(self, accounts: dict = None, history_size: int = HISTORY_SIZE):
+        self.history_size = history_size
+        self.accounts = {}
+        self.accounts_lock = threading.Lock()     # only for opening accounts
+        for number, data in (accounts or {}).items():
+            self.open_account(number, data["Name"], data["Balance"], data["Pin"])
+
+    def open_account(self, number: str, name: str, balance: int = 0, pin: int = 0) -> Account:
+        with self.accounts_lock:
+            if number in self.accounts:
+                raise ATMError(f"Account {number} already exists")
+            account = Account(number, name, balance, pin, self.history_size)
+            self.accounts[number] = account
+            return account
+
+    def get(self, number: str) -> Account:
+        account = self.accounts.get(number)
+        if account is None:
+            raise UnknownAccountError(f"Invalid account {number}")
+        return account
+
+    # -------------------------------------------------------------------------
+    # PIN handling
+    # -------------------------------------------------------------------------
+
+    def login(self, number: str, pin: int) -> "ATMSession":
+        """Check the PIN and return a session; 3 wrong PINs lock the account."""
+        account = self.get(number)
+        with account.lock:
+            if account.locked:
+                raise AccountLockedError("Account Locked. Visit Again")
+            if pin != account.pin:
+                account.failed_pins += 1
+                if account.failed_pins >= MAX_PIN_ATTEMPTS:
+                    account.locked = True
+                    raise AccountLockedError("Account Locked. Visit Again")
+                remaining = MAX_PIN_ATTEMPTS - account.failed_pins
+                raise InvalidPinError(f"You have {remaining} Attempts Left")
+            account.failed_pins = 0
+        return ATMSession(self, account)
+
+    def change_pin(self, number: str, old_pin: int, new_pin: str) -> None:
+        if len(new_pin) != 4 or not new_pin.isdigit():
+            raise ATMError("PIN must be exactly 4 digits")
+        account = self.get(number)
+        with account.lock:
+            if old_pin != account.pin:
+                raise InvalidPinError("Incorrect Current PIN Entered")
+            if int(new_pin) == account.pin:
+                raise ATMError("New PIN cannot be same as old PIN")
+            account.pin = int(new_pin)
+
+    # -------------------------------------------------------------------------
+    # Money
+    # -------------------------------------------------------------------------
+
+    def withdraw(self, number: str, amount: int) -> int:
+        """Take money out; returns the new balance."""
+        if amount <= 0:
+            raise ATMError("Amount must be positive")
+        account = self.get(number)
+        with account.lock:
+            if amount > account.balance:
+                raise InsufficientBalanceError("Insufficient Balance")
+            account.balance -= amount
+            account.history.append(("Withdrawn", amount, account.balance))
+            return account.balance
+
+    def deposit(self, number: str, amount: int) -> int:
+        """Put money in; returns the new balance."""
+        if amount <= 0:
+            raise ATMError("Amount must be positive")
+        account = self.get(number)
+        with account.lock:
+            account.balance += amount
+            account.history.append(("Deposited", amount, account.balance))
+            return account.balance
+
+    def transfer(self, source: str, target: str, amount: int) -> None:
+        """Move money between two accounts atomically."""
+        if amount <= 0:
+            raise ATMError("Amount must be positive")
+        if source == target:
+            raise ATMError("Cannot transfer to the same account")
+        first, second = sorted((self.get(source), self.get(target)), key=lambda a: a.number)
+        with first.lock, second.lock:
+            payer = first if first.number == source else second
+            payee = second if payer is first else first
+            if amount > payer.balance:
+                raise InsufficientBalanceError("Insufficient Balance")
+            payer.balance -= amount
+            payee.balance += amount
+            payer.history.append(("Transferred out", amount, payer.balance))
+            payee.history.append(("Transferred in", amount, payee.balance))
+
+    def balance(self, number: str) -> int:
+        account = self.get(number)
+        with account.lock:
+            return account.balance
+
+    def mini_statement(self, number: str, count: int = STATEMENT_SIZE) -> list:
+        """Last `count` transactions, formatted like Feb_11.py."""
+        account = self.get(number)
+        with account.lock:
+            recent = list(account.history)[-count:]
+        return [f"₹{amount} {kind} | Balance: ₹{balance}"
+                for kind, amount, balance in recent]
+
+    def total_balance(self) -> int:
+        """Sum of all balances (take it while no transactions are running)."""
+        return sum(account.balance for account in list(self.accounts.values()))
+
+
+class ATMSession:
+    """An authenticated user at the machine."""
+
+    def __init__(self, engine: ATMEngine, account: Account):
+        self.engine = engine
+        self.account = account
+
+    def withdraw(self, amount: int) -> int:
+        return self.engine.withdraw(self.account.number, amount)
+
+    def deposit(self, amount: int) -> int:
+        return self.engine.deposit(self.account.number, amount)
+
+    def transfer(self, target: str, amount: int) -> None:
+        self.engine.transfer(self.account.number, target, amount)
+
+    def balance(self) -> int:
+        return self.engine.balance(self.account.number)
+
+    def mini_statement(self, count: int = STATEMENT_SIZE) -> list:
+        return self.engine.mini_statement(self.account.number, count)
+
+    def change_pin(self, old_pin: int, new_pin: str) -> None:
+        self.engine.change_pin(self.account.number, old_pin, new_pin)
+
+
+# =============================================================================
+# STRESS TEST
+# =============================================================================
+
+def stress_test(accounts: int = 1000, threads: int = 16, operations: int = 50_000,
+                seed: int = 0) -> dict:
+    """
+    Run random withdrawals, deposits and transfers from many threads.
+
+    Each thread tallies the cash it put in and took out; afterwards the
+    total of all balances must equal start + deposits - withdrawals
+    (transfers only move money) and no balance may be negative.
+    """
+    engine = ATMEngine()
+    for i in range(accounts):
+        engine.open_account(f"{i:09d}", f"User{i}", 1000, 1234)
+    numbers = list(engine.accounts)
+    start_total = engine.total_balance()
+    flows = [[0, 0, 0] for _ in range(threads)]      # deposited, withdrawn, rejected
+
+    def worker(index: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        flow = flows[index]
+        for _ in range(operations):
+            number = rng.choice(numbers)
+            amount = rng.randint(1, 500)
+            action = rng.random()
+            try:
+                if action < 0.4:
+                    engine.deposit(number, amount)
+                    flow[0] += amount
+                elif action < 0.8:
+                    engine.withdraw(number, amount)
+                    flow[1] += amount
+                else:
+                    target = rng.choice(numbers)
+                    if target != number:
+                        engine.transfer(number, target, amount)
+            except InsufficientBalanceError:
+                flow[2] += 1
+
+    started = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    deposited = sum(flow[0] for flow in flows)
+    withdrawn = sum(flow[1] for flow in flows)
+    expected = start_total + deposited - withdrawn
+    actual = engine.total_balance()
+    return {
+        "accounts": accounts,
+        "threads": threads,
+        "operations": threads * operations,
+        "rejected": sum(flow[2] for flow in flows),
+        "seconds": elapsed,
+        "ops_per_second": threads * operations / elapsed,
+        "expected_total": expected,
+        "actual_total": actual,
+        "conserved": expected == actual,
+        "no_negative_balances": all(a.balance >= 0 for a in engine.accounts.values()),
+        "history_bounded": all(len(a.history) <= engine.history_size
+                               for a in engine.accounts.values()),
+    }
+
+
+if __name__ == "__main__":
+    engine = ATMEngine(DEMO_ACCOUNTS)
+    session = engine.login("667755441", 1234)
+    session.withdraw(500)
+    session.deposit(1200)
+    session.transfer("667755442", 700)
+    print("Mini Statement (Last 5 Transactions):")
+    for line in session.mini_statement():
+        print(line)
+
+    for key, value in stress_test().items():
+        print(f"{key:22}: {value:.0f}" if isinstance(value, float) else f"{key:22}: {value}")
@@ -0,0 +1,187 @@
+"""
+=============================================================================
+BULK TRANSACTION REPLAY for BankAccount / BankATM (Weekly_tests.py)
+=============================================================================
+BankAccount.deposit()/withdraw() print on every call, which is fine at the
+console but turns an end-of-day settlement file into millions of writes to
+the terminal.  This module applies a whole batch of transactions to those
+same objects without any per-transaction I/O:
+
+  * balances are copied into a plain dict once, in integer paise (as in
+    atm_store.py), every transaction is a dict lookup and an integer add,
+    and the final balances are written back to the objects at the end (so
+    a crash mid-file leaves the accounts untouched).  Whole-rupee balances
+    stay ints; others come back as exact Decimals, never floats;
+  * a withdrawal larger than the balance is not applied - it goes to the
+    reject stream together with an InsufficientBalanceError, exactly the
+    error the weekly-test ATM raises; unknown accounts and malformed rows
+    (including amounts with more than 2 decimal places) are rejected with
+    a ValueError;
+  * the result reports counts, elapsed time and transactions per second.
+
+Transaction files are CSV: account,type,amount  (type: deposit / withdraw,
+or D / W).  A header line is allowed.
+
+    accounts = {"Ravi": BankAccount("Ravi", 5000), "atm-1": BankATM(5000)}
+    result = replay_file(accounts, "settlement.csv", "rejects.csv")
+    print(result)
+=============================================================================
+"""
+
+import csv
+import time
+from dataclasses import dataclass, field
+
+from atm_store import from_paise, to_paise
+from Weekly_tests import BankAccount, BankATM, InsufficientBalanceError
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+DEPOSIT = "deposit"
+WITHDRAW = "withdraw"
+KINDS = {"deposit": DEPOSIT, "d": DEPOSIT, "withdraw": WITHDRAW, "w": WITHDRAW}
+READ_BUFFER = 1 << 20           # bytes per read from a settlement file
+
+
+@dataclass
+class BatchResult:
+    applied: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+    rejects: list = field(default_factory=list, repr=False)
+
+    @property
+    def per_second(self) -> float:
+        total = self.applied + self.rejected
+        return total / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.applied} applied, {self.rejected} rejected in "
+                f"{self.seconds:.2f}s ({self.per_second:,.0f} tx/s)")
+
+
+def parse_amount(text) -> int:
+    """Amount in integer paise ("12.50" -> 1250); ValueError if malformed."""
+    return to_paise(text)
+
+
+# =============================================================================
+# REPLAY
+# =============================================================================
+
+def apply_batch(accounts: dict, transactions, on_reject=None) -> BatchResult:
+    """
+    Apply transactions in order to BankAccount / BankATM objects.
+
+    Args:
+        accounts: account id -> object with a .balance attribute
+        transactions: iterable of (account id, type, amount); amount is in
+            rupees, a number or a string
+        on_reject: called as on_reject(transaction, error) for every
+            rejected row; when None, rejects are collected in result.rejects
+
+    Returns:
+        BatchResult
+    """
+    result = BatchResult()
+    rejects = result.rejects
+    report = on_reject if on_reject is not None else (lambda tx, error: rejects.append((tx, error)))
+
+    balances = {key: to_paise(account.balance) for key, account in accounts.items()}
+    kinds = KINDS
+    applied = 0
+    start = time.perf_counter()
+
+    for transaction in transactions:
+        try:
+            key, kind, amount = transaction
+            kind = kinds[kind.strip().lower()]
+            amount = parse_amount(amount)
+            balance = balances[key]
+        except (KeyError, ValueError, AttributeError, TypeError):
+            report(transaction, ValueError(f"Invalid transaction: {transaction!r}"))
+            result.rejected += 1
+            continue
+
+        if amount <= 0:
+            report(transaction, ValueError("Amount must be positive"))
+            result.rejected += 1
+        elif kind is DEPOSIT:
+            balances[key] = balance + amount
+            applied += 1
+        elif amount <= balance:
+            balances[key] = balance - amount
+            applied += 1
+        else:
+            report(transaction, InsufficientBalanceError("Insufficient Balance"))
+            result.rejected += 1
+
+    for key, account in accounts.items():
+        account.balance = from_paise(balances[key])
+    result.applied = applied
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def read_transactions(path: str):
+    """Yield (account, type, amount) rows from a CSV file, skipping a header."""
+    with open(path, newline="", encoding="utf-8", buffering=READ_BUFFER) as file:
+        for number, row in enumerate(csv.reader(file)):
+            if not row or row[0].startswith("#"):
+                continue
+            if number == 0 and row[-1].strip().lower() == "amount":
+                continue            # header
+            yield tuple(row)
+
+
+def replay_file(accounts: dict, path: str, reject_path: str = None) -> BatchResult:
+    """Replay a settlement file; rejected rows (plus the reason) go to reject_path."""
+    if reject_path is None:
+        return apply_batch(accounts, read_transactions(path))
+
+    with open(reject_path, "w", newline="", encoding="utf-8") as out:
+        writer = csv.writer(out)
+        writer.writerow(["account", "type", "amount", "error"])
+        result = apply_batch(
+            accounts, read_transactions(path),
+            lambda tx, error: writer.writerow([*tx, f"{type(error).__name__}: {error}"]))
+    return result
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+def write_sample_file(path: str, accounts: list, count: int, seed: int = 0) -> None:
+    import random
+
+    rng = random.Random(seed)
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["account", "type", "amount"])
+        for _ in range(count):
+            kind = DEPOSIT if rng.random() < 0.5 else WITHDRAW
+            writer.writerow([rng.choice(accounts), kind, rng.randint(1, 5000)])
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    import tempfile
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    accounts = {f"C{i:05d}": BankAccount(f"C{i:05d}", 10_000) for i in range(10_000)}
+    accounts["atm-1"] = BankATM(50_000)
+
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, "settlement.csv")
+    write_sample_file(path, list(accounts), count)
+
+    before = sum(a.balance for a in accounts.values())
+    result = replay_file(accounts, path, os.path.join(folder, "rejects.csv"))
+    print(result)
+    print("Total balance:", before, "->", sum(a.balance for a in accounts.values()))
+    print("Rejects written to", os.path.join(folder, "rejects.csv"))
@@ -0,0 +1,363 @@
+"""
+=============================================================================
+PERSISTENT MEMOIZATION (SQLite)
+=============================================================================
+memoize / fibonacci_cache in the notes (and memoize.py) lose everything
+when the process exits.  @disk_memoize stores results in a SQLite file,
+so an expensive pure function - N-Queens counts, huge factorials - is
+computed once and reused by later runs and by other worker processes.
+
+  * Key = function identity (module + qualified name) + a version hash +
+    the arguments.  The version hash covers the function's bytecode and
+    constants, so editing the function body invalidates its old entries
+    automatically; pass version="2" to force it by hand.  Arguments are
+    bound to the signature with defaults applied (f(1) and f(n=1) share
+    an entry) and sets are sorted, so every process builds the same key.
+  * Values are pickled.  The pickled values are kept under `max_bytes` in
+    total by deleting the least recently used entries; the file itself is
+    somewhat larger (keys, index, WAL).  A result that cannot be pickled,
+    or a database too busy to write, is returned without being stored.
+  * Several processes may share one file: WAL mode lets readers run while
+    one process writes, writes use BEGIN IMMEDIATE with a busy timeout,
+    and each process / thread opens its own connection.  Two processes
+    missing on the same key at the same moment both compute it; the
+    results are identical, so whichever is stored last is fine.
+
+    @disk_memoize(path="results.sqlite")
+    def count_solutions(n): ...
+
+    count_solutions(14)             # computed and stored
+    count_solutions(14)             # read back, also in the next run
+    count_solutions.cache_stats()
+=============================================================================
+"""
+
+import hashlib
+import inspect
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from functools import wraps
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+DEFAULT_PATH = os.environ.get(
+    "DISK_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "disk_cache.sqlite"))
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+BUSY_TIMEOUT = 30.0                 # seconds to wait for another process's write
+TOUCH_INTERVAL = 60.0               # refresh last_used at most this often per entry
+PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key       TEXT PRIMARY KEY,
+    function  TEXT NOT NULL,
+    value     BLOB NOT NULL,
+    size      INTEGER NOT NULL,
+    created   REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+CREATE TABLE IF NOT EXISTS meta (
+    name  TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta VALUES ('total_bytes', 0);
+"""
+
+
+def _hash_code(code, digest) -> None:
+    """Feed a code object into digest without anything process-specific."""
+    digest.update(code.co_code)
+    digest.update(repr((code.co_names, code.co_varnames)).encode())
+    for constant in code.co_consts:
+        _hash_constant(constant, digest)
+
+
+def _hash_constant(constant, digest) -> None:
+    # Nested code (comprehensions, lambdas, inner defs) would repr with its
+    # memory address, and frozenset order changes with hash randomisation
+    if hasattr(constant, "co_code"):
+        digest.update(b"code(")
+        _hash_code(constant, digest)
+        digest.update(b")")
+    elif isinstance(constant, tuple):
+        digest.update(b"tuple(")
+        for item in constant:
+            _hash_constant(item, digest)
+        digest.update(b")")
+    elif isinstance(constant, frozenset):
+        digest.update(b"frozenset(")
+        for item in sorted(constant, key=repr):
+            _hash_constant(item, digest)
+        digest.update(b")")
+    else:
+        digest.update(f"{type(constant).__name__}:{constant!r};".encode())
+
+
+def function_version(func) -> str:
+    """Hash of the function's code, so a changed body gets fresh entries."""
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return "0"
+    digest = hashlib.sha256()
+    _hash_code(code, digest)
+    return digest.hexdigest()[:16]
+
+
+class _SortedSet(tuple):
+    """A set argument as a sorted tuple: set order changes between processes."""
+
+    __slots__ = ()
+
+
+def _canonical(value):
+    """value with every set / frozenset inside it replaced by a _SortedSet."""
+    if isinstance(value, (set, frozenset)):
+        items = [_canonical(item) for item in value]
+        return _SortedSet(sorted(items, key=lambda item: pickle.dumps(item, PICKLE_PROTOCOL)))
+    if type(value) in (tuple, list):
+        return type(value)(_canonical(item) for item in value)
+    if type(value) is dict:
+        return {key: _canonical(item) for key, item in value.items()}
+    return value
+
+
+def make_key(function_id: str, args: tuple, kwargs: dict) -> str:
+    payload = pickle.dumps(_canonical((args, sorted(kwargs.items()))), PICKLE_PROTOCOL)
+    return hashlib.sha256(function_id.encode() + b"\0" + payload).hexdigest()
+
+
+def argument_binder(func):
+    """
+    Return bind(args, kwargs) -> (args, kwargs) for calls to func, with the
+    arguments bound to its signature and defaults applied (as in memoize.py).
+    """
+    try:
+        signature = inspect.signature(func)
+    except (TypeError, ValueError):
+        return lambda args, kwargs: (args, kwargs)
+
+    params = signature.parameters.values()
+    plain = all(p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD) for p in params)
+    arity = len(signature.parameters)
+
+    def bind(args: tuple, kwargs: dict):
+        if plain and not kwargs and len(args) == arity:
+            return args, kwargs             # already complete; skip binding
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return bound.args, bound.kwargs
+
+    return bind
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class DiskCache:
+    """Key -> pickled value table in a SQLite file with an LRU size limit."""
+
+    def __init__(self, path: str = DEFAULT_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.local = threading.local()
+        self.hits = self.misses = self.evictions = 0
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+        conn = self.connection()
+        conn.executescript(SCHEMA)
+
+    def connection(self) -> sqlite3.Connection:
+        """One connection per thread, reopened after a fork."""
+        conn = getattr(self.local, "conn", None)
+        if conn is None or self.local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+            self.local.pid = os.getpid()
+        return conn
+
+    def get(self, key: str):
+        """(True, value) if the key is stored, else (False, None)."""
+        conn = self.connection()
+        row = conn.execute("SELECT value, last_used FROM entries WHERE key = ?",
+                           (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        value, last_used = row
+        now = time.time()
+        # Keep LRU order roughly right without a write on every hit
+        if now - last_used > TOUCH_INTERVAL:
+            try:
+                conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (now, key))
+            except sqlite3.OperationalError:
+                pass                    # database busy: the touch can wait
+        return True, pickle.loads(value)
+
+    def set(self, key: str, value, function: str = "") -> None:
+        blob = pickle.dumps(value, PICKLE_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            return
+        now = time.time()
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            old = conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                         (key, function, blob, len(blob), now, now))
+            total = self._add_bytes(conn, len(blob) - (old[0] if old else 0))
+            if total > self.max_bytes:
+                self._evict(conn, total)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _add_bytes(self, conn, delta: int) -> int:
+        conn.execute("UPDATE meta SET value = value + ? WHERE name = 'total_bytes'", (delta,))
+        return conn.execute("SELECT value FROM meta WHERE name = 'total_bytes'").fetchone()[0]
+
+    def _evict(self, conn, total: int) -> None:
+        """Delete least recently used entries until the values fit in max_bytes."""
+        rows = conn.execute("SELECT key, size FROM entries ORDER BY last_used")
+        doomed, freed = [], 0
+        for key, size in rows:
+            if total - freed <= self.max_bytes:
+                break
+            doomed.append((key,))
+            freed += size
+        conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+        self._add_bytes(conn, -freed)
+        self.evictions += len(doomed)
+
+    def clear(self, function: str = None) -> None:
+        """Drop every entry, or only those of one function."""
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if function is None:
+                conn.execute("DELETE FROM entries")
+                conn.execute("UPDATE meta SET value = 0 WHERE name = 'total_bytes'")
+            else:
+                freed = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries "
+                                     "WHERE function = ?", (function,)).fetchone()[0]
+                conn.execute("DELETE FROM entries WHERE function = ?", (function,))
+                self._add_bytes(conn, -freed)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def stats(self) -> dict:
+        conn = self.connection()
+        entries, size = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"entries": entries, "bytes": size, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def close(self) -> None:
+        conn = getattr(self.local, "conn", None)
+        if conn is not None and self.local.pid == os.getpid():
+            conn.close()
+        self.local.conn = None
+
+
+# =============================================================================
+# DECORATOR
+# =============================================================================
+
+_caches = {}                        # path -> DiskCache shared by decorators
+_caches_lock = threading.Lock()
+
+
+def get_cache(path: str = DEFAULT_PATH, max_bytes: int = DEFAULT_MAX_BYTES) -> DiskCache:
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = DiskCache(path, max_bytes)
+        return cache
+
+
+def disk_memoize(function=None, *, path: str = DEFAULT_PATH,
+                 max_bytes: int = DEFAULT_MAX_BYTES, version: str = None):
+    """
+    Cache a pure function's results on disk.
+
+    Args:
+        path: SQLite file (shared by every function that names it)
+        max_bytes: size limit for the pickled values in that file
+        version: extra version tag; by default only the code hash is used
+
+    Arguments must be picklable; results that are not are simply not
+    stored.  Can be used bare (@disk_memoize) or with options
+    (@disk_memoize(path=...)).
+    """
+    def decorator(func):
+        function_id = f"{func.__module__}.{func.__qualname__}"
+        versioned_id = f"{function_id}:{function_version(func)}:{version or ''}"
+        bind = argument_binder(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_cache(path, max_bytes)
+            key = make_key(versioned_id, *bind(args, kwargs))
+            found, value = cache.get(key)
+            if found:
+                return value
+            value = func(*args, **kwargs)
+            try:
+                cache.set(key, value, function_id)
+            except (pickle.PicklingError, AttributeError, TypeError, sqlite3.Error):
+                pass                    # unpicklable result or busy file: just don't cache
+            return value
+
+        wrapper.cache_clear = lambda: get_cache(path, max_bytes).clear(function_id)
+        wrapper.cache_stats = lambda: get_cache(path, max_bytes).stats()
+        return wrapper
+
+    return decorator(function) if function is not None else decorator
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+def _factorial_bits(n):
+    from factorials import factorial
+
+    return factorial(n).bit_length()
+
+
+def _demo_worker(args):
+    path, n = args
+    return n, disk_memoize(path=path)(_factorial_bits)(n)
+
+
+if __name__ == "__main__":
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+
+    path = os.path.join(tempfile.mkdtemp(), "demo_cache.sqlite")
+    factorial_bits = disk_memoize(path=path)(_factorial_bits)
+
+    for attempt in ("first call", "second call"):
+        start = time.perf_counter()
+        bits = factorial_bits(200_000)
+        print(f"{attempt}: 200000! has {bits} bits ({time.perf_counter() - start:.3f}s)")
+
+    # Several processes filling and reading the same file at once
+    jobs = [(path, n) for n in range(20_000, 30_000, 500)] * 2
+    with ProcessPoolExecutor(4) as pool:
+        results = dict(pool.map(_demo_worker, jobs))
+    print(f"{len(jobs)} jobs from 4 processes -> {len(results)} distinct results")
+    print(get_cache(path).stats())
@@ -0,0 +1,211 @@
+"""
+=============================================================================
+FIBONACCI ENGINE
+=============================================================================
+The notes compute Fibonacci numbers several ways:
+
+    fibnocii_nuber      Recursive_Functions.py   plain recursion, O(phi^n) calls
+    fibonacci           Functions_notes.py       plain recursion
+    fibonacci_memo      Functions_notes.py       lru_cache recursion (depth n)
+    fibonacci_cache     Functions_notes.py       dict memoize (depth n)
+    fibonacci           Nested_Functions.py      dict memoize (depth n)
+    fibonacci_generator Generators_Notes.py      infinite a, b = b, a + b loop
+    Fibnocci_series.py                           the same loop, printed
+
+This module is the one to use from code:
+
+  * fib(n)            - fast doubling, O(log n) big-int multiplications:
+                          F(2k)   = F(k) * (2*F(k+1) - F(k))
+                          F(2k+1) = F(k)^2 + F(k+1)^2
+                        F(10^6) (208988 digits) takes under 0.1 s, where
+                        the addition loop takes ~10 s; negative n follows
+                        F(-n) = (-1)^(n+1) F(n).
+  * fib_matrix(n)     - [[1,1],[1,0]]^n by repeated squaring (same order,
+                        more multiplications; kept for comparison).
+  * fib_mod(n, m)     - F(n) mod m without ever building the big number.
+  * fib_range(a, b)   - F(a) .. F(b-1) lazily: one fast-doubling jump to a,
+                        then one addition per value.
+  * fib_sequence(k)   - the first k numbers as a list, served from a cache.
+
+Run the file for a benchmark against the notes' versions.
+=============================================================================
+"""
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+SEQUENCE_CACHE_LIMIT = 10_000       # largest list fib_sequence() keeps around
+
+_sequence = [0, 1]
+
+
+# =============================================================================
+# SINGLE VALUES
+# =============================================================================
+
+def fib_pair(n: int) -> tuple:
+    """(F(n), F(n+1)) for n >= 0, by fast doubling over the bits of n."""
+    if n < 0:
+        raise ValueError("fib_pair() needs n >= 0")
+    a, b = 0, 1                         # F(0), F(1)
+    for bit in bin(n)[2:]:
+        # (F(k), F(k+1)) -> (F(2k), F(2k+1))
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d             # -> (F(2k+1), F(2k+2))
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fib(n: int) -> int:
+    """The n-th Fibonacci number (F(0) = 0, F(1) = 1); n may be negative."""
+    if 0 <= n < len(_sequence):
+        return _sequence[n]
+    if n < 0:
+        value = fib_pair(-n)[0]
+        return value if n % 2 else -value
+    return fib_pair(n)[0]
+
+
+def fib_matrix(n: int) -> int:
+    """F(n) from the n-th power of [[1, 1], [1, 0]]."""
+    if n < 0:
+        raise ValueError("fib_matrix() needs n >= 0")
+    # Matrices stored as (a, b, c, d) for [[a, b], [c, d]]
+    result = (1, 0, 0, 1)
+    base = (1, 1, 1, 0)
+    while n:
+        if n & 1:
+            result = _multiply(result, base)
+        base = _multiply(base, base)
+        n >>= 1
+    return result[1]
+
+
+def _multiply(x: tuple, y: tuple) -> tuple:
+    a, b, c, d = x
+    e, f, g, h = y
+    return (a * e + b * g, a * f + b * h, c * e + d * g, c * f + d * h)
+
+
+def fib_mod(n: int, m: int) -> int:
+    """F(n) mod m for n >= 0; every intermediate stays below m^2."""
+    if n < 0 or m <= 0:
+        raise ValueError("fib_mod() needs n >= 0 and m > 0")
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a) % m
+        d = (a * a + b * b) % m
+        if bit == "1":
+            a, b = d, (c + d) % m
+        else:
+            a, b = c, d
+    return a % m
+
+
+# =============================================================================
+# SEQUENCES
+# =============================================================================
+
+def fib_range(start: int, stop: int):
+    """Yield F(start), F(start+1), ..., F(stop-1)."""
+    if start < 0:
+        raise ValueError("fib_range() needs start >= 0")
+    if start >= stop:
+        return
+    a, b = fib_pair(start)
+    for _ in range(stop - start):
+        yield a
+        a, b = b, a + b
+
+
+def fib_sequence(count: int) -> list:
+    """The first `count` Fibonacci numbers; short prefixes are cached."""
+    if count < 0:
+        raise ValueError("fib_sequence() needs count >= 0")
+    if count <= len(_sequence):
+        return _sequence[:count]
+    if count > SEQUENCE_CACHE_LIMIT:
+        return list(fib_range(0, count))
+    a, b = _sequence[-2], _sequence[-1]
+    for _ in range(count - len(_sequence)):
+        a, b = b, a + b
+        _sequence.append(b)
+    return _sequence[:count]
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def _series_loop(n: int) -> int:
+    """Fibnocci_series.py's loop, without input()/print()."""
+    a, b = 1, 0
+    for _ in range(n - 1):
+        a, b = a + b, a
+    return a if n else 0
+
+
+def benchmark() -> None:
+    import contextlib
+    import io
+    import itertools
+    import sys
+    import time
+
+    # The notes print their examples when imported
+    with contextlib.redirect_stdout(io.StringIO()):
+        import Functions_notes
+        import Generators_Notes
+        import Nested_Functions
+        import Recursive_Functions
+    limit = sys.getrecursionlimit()
+
+    def generator_nth(n):
+        return next(itertools.islice(Generators_Notes.fibonacci_generator(), n, None))
+
+    def timed(function, n, repeat=1):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            value = function(n)
+        return value, (time.perf_counter() - start) / repeat
+
+    variants = [
+        # (name, function, largest n it can handle in reasonable time/stack)
+        ("fibnocii_nuber (recursive)", Recursive_Functions.fibnocii_nuber, 25),
+        ("Functions_notes.fibonacci", Functions_notes.fibonacci, 25),
+        ("fibonacci_memo (lru_cache)", Functions_notes.fibonacci_memo, limit // 4),
+        ("fibonacci_cache (memoize)", Functions_notes.fibonacci_cache, limit // 4),
+        ("Nested_Functions.fibonacci", Nested_Functions.fibonacci, limit // 4),
+        ("fibonacci_generator", generator_nth, 10 ** 5),
+        ("Fibnocci_series loop", _series_loop, 10 ** 5),
+        ("fib_matrix", fib_matrix, 10 ** 6),
+        ("fib (fast doubling)", fib, 10 ** 7),
+    ]
+    print(f"{'variant':28} {'n':>9} {'seconds':>10}")
+    for n in (25, 1_000, 100_000, 1_000_000, 10_000_000):
+        expected = fib(n)
+        for name, function, largest in variants:
+            if n > largest:
+                continue
+            try:
+                value, seconds = timed(function, n)
+            except RecursionError:
+                print(f"{name:28} {n:9} {'RecursionError':>10}")
+                continue
+            flag = "" if value == expected else "  WRONG"
+            print(f"{name:28} {n:9} {seconds:10.4f}{flag}")
+        print()
+
+    _, seconds = timed(lambda n: fib_mod(n, 10 ** 9 + 7), 10 ** 18, repeat=1000)
+    print(f"fib_mod(10^18, 10^9+7): {seconds * 1e6:.1f} us")
+    _, seconds = timed(lambda n: sum(1 for _ in fib_range(n, n + 10_000)), 10 ** 6)
+    print(f"fib_range(10^6, 10^6 + 10^4): {seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,104 @@
+"""
+=============================================================================
+LUCKY 7 - CONSOLE CLIENT for lucky7_server.py
+=============================================================================
+Type short commands; they are sent to the server as JSON lines and every
+reply or dice roll is printed as it arrives.
+
+    signup <username> <name>     login <username>     otp <code>
+    join [table]                 bet <+7|-7|==7>      stats
+    top [k]                      leave                quit
+
+    python lucky7_client.py --host 127.0.0.1 --port 7777
+=============================================================================
+"""
+
+import argparse
+import asyncio
+import json
+
+
+def parse_command(line: str):
+    """Turn a typed command into a protocol message (None if not understood)."""
+    parts = line.split()
+    if not parts:
+        return None
+    command, args = parts[0].lower(), parts[1:]
+    if command == "signup" and len(args) >= 2:
+        return {"cmd": "signup", "username": args[0], "name": " ".join(args[1:])}
+    if command == "login" and len(args) == 1:
+        return {"cmd": "login", "username": args[0]}
+    if command == "otp" and len(args) == 1:
+        return {"cmd": "otp", "code": args[0]}
+    if command == "join":
+        return {"cmd": "join", "table": args[0] if args else "main"}
+    if command == "bet" and len(args) == 1:
+        return {"cmd": "bet", "bet": args[0]}
+    if command == "top":
+        return {"cmd": "top", "k": int(args[0]) if args and args[0].isdigit() else 10}
+    if command in ("stats", "leave", "quit") and not args:
+        return {"cmd": command}
+    return None
+
+
+def show(message: dict) -> None:
+    """Print one server message in a readable form."""
+    if message.get("event") == "roll":
+        print(f"\n🎲 [{message['table']}] Dice Rolled: {message['die1']} and "
+              f"{message['die2']}  Total: {message['total']}")
+        points = message.get("points")
+        if points is not None:
+            print(f"   You Won! +{points} Points" if points > 0 else f"   You Lost! {points} Points")
+    elif message.get("ok") is False:
+        print(f"❌ {message.get('error')}")
+    elif "top" in message:
+        for position, (username, score) in enumerate(message["top"], start=1):
+            print(f"  {position:3}. {username:20} {score}")
+    elif "stats" in message:
+        print(f"📊 {message['stats']}")
+    else:
+        print(f"✅ {message.get('message', message)}")
+
+
+async def receive(reader) -> None:
+    while True:
+        line = await reader.readline()
+        if not line:
+            print("\nConnection closed by server.")
+            return
+        show(json.loads(line))
+
+
+async def run(host: str, port: int) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    receiver = asyncio.create_task(receive(reader))
+    loop = asyncio.get_running_loop()
+    print(__doc__.split("\n\n")[1])
+    try:
+        while not receiver.done():
+            line = await loop.run_in_executor(None, input, "> ")
+            message = parse_command(line)
+            if message is None:
+                print("Unknown command.")
+                continue
+            writer.write((json.dumps(message) + "\n").encode())
+            await writer.drain()
+            if message["cmd"] == "quit":
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        writer.close()
+        receiver.cancel()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Lucky 7 network client.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    args = parser.parse_args()
+    asyncio.run(run(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+=============================================================================
+LUCKY 7 - LEADERBOARD (indexable skip list)
+=============================================================================
+Ranks players by score without ever sorting the whole `users` dict.
+
+Entries live in a skip list ordered by (-score, username), i.e. highest
+score first and ties broken alphabetically.  Every forward link also
+stores its WIDTH - how many entries it jumps over - so the position of an
+entry is the sum of the widths walked to reach it.
+
+    update(username, score)   O(log n)   insert or move a player
+    rank(username)            O(log n)   1-based position
+    top(k)                    O(k)
+    remove(username)          O(log n)
+
+    board = Leaderboard()
+    board.update("ravi", 40)
+    board.update("asha", 55)
+    board.top(10)       # [("asha", 55), ("ravi", 40)]
+    board.rank("ravi")  # 2
+=============================================================================
+"""
+
+import random
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+MAX_LEVEL = 32          # enough for 2**32 players with P = 0.5
+PROMOTE_PROBABILITY = 0.5
+
+
+# =============================================================================
+# SKIP LIST
+# =============================================================================
+
+class _Node:
+    __slots__ = ("key", "username", "score", "next", "width")
+
+    def __init__(self, key, username, score, level):
+        self.key = key
+        self.username = username
+        self.score = score
+        self.next = [None] * level
+        self.width = [1] * level
+
+
+class Leaderboard:
+    """Score-ordered player index with logarithmic updates and rank queries."""
+
+    def __init__(self, users: dict = None, seed: int = None):
+        """
+        Args:
+            users: optional Lucky 7 users dict to load ({username: {"score": ...}})
+            seed: seed for the level coin flips (for reproducible layouts)
+        """
+        self.head = _Node(None, None, None, MAX_LEVEL)
+        self.level = 1
+        self.scores = {}            # username -> current score
+        self.random = random.Random(seed)
+        if users:
+            self._bulk_load((username, data["score"]) for username, data in users.items())
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def __contains__(self, username) -> bool:
+        return username in self.scores
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < MAX_LEVEL and self.random.random() < PROMOTE_PROBABILITY:
+            level += 1
+        return level
+
+    def _find_path(self, key) -> tuple:
+        """Return (last node before key per level, rank of that node per level)."""
+        update = [None] * MAX_LEVEL
+        ranks = [0] * MAX_LEVEL
+        node = self.head
+        position = 0
+        for i in range(self.level - 1, -1, -1):
+            while node.next[i] is not None and node.next[i].key < key:
+                position += node.width[i]
+                node = node.next[i]
+            update[i] = node
+            ranks[i] = position
+        return update, ranks
+
+    def _bulk_load(self, pairs) -> None:
+        """Build an empty board from (username, score) pairs in O(n log n)."""
+        entries = sorted(((-score, username), username, score) for username, score in pairs)
+        last = [self.head] * MAX_LEVEL      # last node linked on each level
+        last_position = [0] * MAX_LEVEL
+        for position, (key, username, score) in enumerate(entries, start=1):
+            level = self._random_level()
+            self.level = max(self.level, level)
+            node = _Node(key, username, score, level)
+            for i in range(level):
+                last[i].next[i] = node
+                last[i].width[i] = position - last_position[i]
+                last[i] = node
+                last_position[i] = position
+            self.scores[username] = score
+        # Tail links point past the end of the list
+        for i in range(MAX_LEVEL):
+            last[i].width[i] = len(entries) + 1 - last_position[i]
+
+    def _insert(self, username: str, score: int) -> None:
+        key = (-score, username)
+        update, ranks = self._find_path(key)
+        level = self._random_level()
+        if level > self.level:
+            for i in range(self.level, level):
+                update[i] = self.head
+                ranks[i] = 0
+                self.head.width[i] = len(self.scores) + 1
+            self.level = level
+
+        node = _Node(key, username, score, level)
+        position = ranks[0] + 1         # 1-based position of the new node
+        for i in range(level):
+            before = update[i]
+            node.next[i] = before.next[i]
+            before.next[i] = node
+            # Split the old link's width between "before -> node" and "node -> next"
+            node.width[i] = before.width[i] - (position - ranks[i]) + 1
+            before.width[i] = position - ranks[i]
+        for i in range(level, self.level):
+            update[i].width[i] += 1
+        self.scores[username] = score
+
+    def _delete(self, username: str) -> None:
+        key = (-self.scores[username], username)
+        update, _ = self._find_path(key)
+        node = update[0].next[0]
+        for i in range(self.level):
+            if update[i].next[i] is node:
+                update[i].width[i] += node.width[i] - 1
+                update[i].next[i] = node.next[i]
+            else:
+                update[i].width[i] -= 1
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        del self.scores[username]
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def update(self, username: str, score: int) -> None:
+        """Insert the player or move them to their new score."""
+        old = self.scores.get(username)
+        if old == score:
+            return
+        if old is not None:
+            self._delete(username)
+        self._insert(username, score)
+
+    def remove(self, username: str) -> None:
+        """Drop a player from the board (no error if absent)."""
+        if username in self.scores:
+            self._delete(username)
+
+    def rank(self, username: str):
+        """1-based rank of the player, or None if not on the board."""
+        if username not in self.scores:
+            return None
+        key = (-self.scores[username], username)
+        node = self.head
+        position = 0
+        for i in range(self.level - 1, -1, -1):
+            while node.next[i] is not None and node.next[i].key <= key:
+                position += node.width[i]
+                node = node.next[i]
+        return position
+
+    def top(self, k: int = 10) -> list:
+        """Return the best k players as [(username, score)]."""
+        result = []
+        node = self.head.next[0]
+        while node is not None and len(result) < k:
+            result.append((node.username, node.score))
+            node = node.next[0]
+        return result
+
+    def at(self, position: int):
+        """Return (username, score) at a 1-based rank, or None if out of range."""
+        if not 1 <= position <= len(self.scores):
+            return None
+        node = self.head
+        walked = 0
+        for i in range(self.level - 1, -1, -1):
+            while node.next[i] is not None and walked + node.width[i] <= position:
+                walked += node.width[i]
+                node = node.next[i]
+        return node.username, node.score
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+if __name__ == "__main__":
+    import time
+
+    players = 1_000_000
+    users = {f"player{i}": {"score": random.randint(-500, 5000)} for i in range(players)}
+    start = time.perf_counter()
+    board = Leaderboard(users, seed=7)
+    print(f"Loaded {players} players in {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    for _ in range(100_000):
+        board.update(f"player{random.randrange(players)}", random.randint(-500, 5000))
+    print(f"100000 score updates in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    ranks = [board.rank(f"player{random.randrange(players)}") for _ in range(100_000)]
+    print(f"100000 rank queries in {time.perf_counter() - start:.2f}s")
+    print("Top 5:", board.top(5))
@@ -0,0 +1,101 @@
+"""
+=============================================================================
+LUCKY 7 - LOAD GENERATOR for lucky7_server.py
+=============================================================================
+Opens many simulated players at once.  Each one signs up with a fresh
+username, joins one of the tables, and bets every round until it has seen
+--rounds rolls.  At the end it prints connect time, settled bets per
+second and the time from placing a bet to receiving its roll.
+
+Point the server at a scratch database first, e.g.
+
+    LUCKY7_DB=/tmp/load.db python lucky7_server.py --round-seconds 0.5
+    python lucky7_loadgen.py --players 2000 --tables 20 --rounds 10
+
+Thousands of sockets may need a higher open-file limit (ulimit -n).
+=============================================================================
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+import uuid
+
+BETS = ["+7", "-7", "==7"]
+
+
+async def request(reader, writer, message: dict) -> dict:
+    """Send a command and return its reply, skipping roll events."""
+    writer.write((json.dumps(message) + "\n").encode())
+    await writer.drain()
+    while True:
+        reply = json.loads(await reader.readline())
+        if reply.get("reply") == message["cmd"]:
+            return reply
+
+
+async def player(number: int, args, run_id: str, stats: dict) -> None:
+    try:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+    except OSError:
+        stats["connect_errors"] += 1
+        return
+    try:
+        reply = await request(reader, writer, {"cmd": "signup",
+                                               "username": f"load_{run_id}_{number}",
+                                               "name": f"Load {number}"})
+        if not reply["ok"]:
+            stats["errors"] += 1
+            return
+        await request(reader, writer, {"cmd": "join", "table": f"table{number % args.tables}"})
+
+        for _ in range(args.rounds):
+            placed = time.perf_counter()
+            await request(reader, writer, {"cmd": "bet", "bet": random.choice(BETS)})
+            while True:
+                message = json.loads(await reader.readline())
+                if message.get("event") == "roll" and message.get("points") is not None:
+                    break
+            stats["latencies"].append(time.perf_counter() - placed)
+            stats["bets"] += 1
+        await request(reader, writer, {"cmd": "quit"})
+    except (ConnectionError, ValueError):
+        stats["errors"] += 1
+    finally:
+        writer.close()
+
+
+async def run(args) -> None:
+    stats = {"bets": 0, "errors": 0, "connect_errors": 0, "latencies": []}
+    run_id = uuid.uuid4().hex[:8]
+    start = time.perf_counter()
+    await asyncio.gather(*(player(i, args, run_id, stats) for i in range(args.players)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(stats["latencies"])
+    print(f"\n{'=' * 50}")
+    print(f"  LUCKY 7 LOAD TEST - {args.players} players, {args.tables} tables")
+    print(f"{'=' * 50}")
+    print(f"Elapsed:          {elapsed:.2f}s")
+    print(f"Settled bets:     {stats['bets']}  ({stats['bets'] / elapsed:.0f}/s)")
+    print(f"Errors:           {stats['errors']}  (connect: {stats['connect_errors']})")
+    if latencies:
+        print(f"Bet -> roll:      median {statistics.median(latencies):.3f}s  "
+              f"p95 {latencies[int(len(latencies) * 0.95) - 1]:.3f}s  max {latencies[-1]:.3f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load generator for the Lucky 7 server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--tables", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=5, help="bets per player")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+=============================================================================
+LUCKY 7 - OTP SERVICE
+=============================================================================
+One-time passwords for Lucky 7 login.
+
+  * Codes come from the `secrets` module (not `random`, which is
+    predictable once a few outputs are seen).
+  * Every code expires after OTP_TTL seconds.  Expiry times sit in a
+    min-heap, so each issue() sweeps out the expired codes from the front
+    in O(log n) apiece - no full scans, and memory stays bounded by the
+    number of codes issued within one TTL.
+  * verify() compares with hmac.compare_digest (constant time), burns the
+    code on success, and after MAX_ATTEMPTS wrong guesses.
+  * Each user may request at most MAX_ISSUES_PER_WINDOW codes per
+    THROTTLE_WINDOW seconds; beyond that issue() raises OTPThrottled.
+
+    otps = OTPService()
+    code = otps.issue("ravi")           # show / send to the user
+    otps.verify("ravi", "4821")         # True or False
+=============================================================================
+"""
+
+import heapq
+import hmac
+import secrets
+import time
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+OTP_DIGITS = 4
+OTP_TTL = 120                   # seconds a code stays valid
+MAX_ATTEMPTS = 3                # wrong guesses before the code is burned
+MAX_ISSUES_PER_WINDOW = 3       # codes per user ...
+THROTTLE_WINDOW = 300           # ... per this many seconds
+MAX_ACTIVE_CODES = 1_000_000    # hard cap on live codes
+
+
+class OTPThrottled(Exception):
+    """Raised when a user asks for codes too often (or the service is full)."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# =============================================================================
+# SERVICE
+# =============================================================================
+
+class OTPService:
+    """Issues and checks expiring one-time codes, one live code per user."""
+
+    def __init__(self, ttl: float = OTP_TTL, digits: int = OTP_DIGITS,
+                 max_attempts: int = MAX_ATTEMPTS,
+                 max_issues: int = MAX_ISSUES_PER_WINDOW,
+                 window: float = THROTTLE_WINDOW,
+                 max_active: int = MAX_ACTIVE_CODES, clock=time.monotonic):
+        self.ttl = ttl
+        self.digits = digits
+        self.max_attempts = max_attempts
+        self.max_issues = max_issues
+        self.window = window
+        self.max_active = max_active
+        self.clock = clock
+
+        self.codes = {}         # username -> [code, expires_at, attempts_left]
+        self.expiry = []        # heap of (expires_at, username)
+        self.issued = {}        # username -> (window_start, codes issued in window)
+        self.windows = []       # heap of (window_end, username) for the throttle table
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def sweep(self) -> None:
+        """Forget expired codes and finished throttle windows."""
+        now = self.clock()
+        while self.expiry and self.expiry[0][0] <= now:
+            expires_at, username = heapq.heappop(self.expiry)
+            entry = self.codes.get(username)
+            # A newer code for the same user has its own heap entry
+            if entry is not None and entry[1] == expires_at:
+                del self.codes[username]
+        while self.windows and self.windows[0][0] <= now:
+            window_end, username = heapq.heappop(self.windows)
+            entry = self.issued.get(username)
+            if entry is not None and entry[0] + self.window == window_end:
+                del self.issued[username]
+
+    def issue(self, username: str) -> str:
+        """Create a fresh code for the user, replacing any earlier one."""
+        self.sweep()
+        now = self.clock()
+
+        window_start, count = self.issued.get(username, (now, 0))
+        if count >= self.max_issues:
+            retry_after = window_start + self.window - now
+            raise OTPThrottled("Too many OTP requests", retry_after)
+        if username not in self.codes and len(self.codes) >= self.max_active:
+            raise OTPThrottled("OTP service is busy", self.expiry[0][0] - now)
+
+        if count == 0:
+            heapq.heappush(self.windows, (window_start + self.window, username))
+        self.issued[username] = (window_start, count + 1)
+
+        code = f"{secrets.randbelow(10 ** self.digits):0{self.digits}d}"
+        expires_at = now + self.ttl
+        self.codes[username] = [code, expires_at, self.max_attempts]
+        heapq.heappush(self.expiry, (expires_at, username))
+        return code
+
+    def verify(self, username: str, code: str) -> bool:
+        """Check a code; a correct code can only be used once."""
+        entry = self.codes.get(username)
+        if entry is None:
+            return False
+        expected, expires_at, attempts_left = entry
+        if expires_at <= self.clock():
+            del self.codes[username]
+            return False
+
+        if hmac.compare_digest(expected.encode(), str(code).strip().encode()):
+            del self.codes[username]
+            return True
+
+        entry[2] = attempts_left - 1
+        if entry[2] <= 0:
+            del self.codes[username]
+        return False
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+if __name__ == "__main__":
+    otps = OTPService(ttl=60)
+    start = time.perf_counter()
+    for i in range(200_000):
+        otps.issue(f"player{i}")
+    print(f"200000 codes issued in {time.perf_counter() - start:.2f}s, live: {len(otps)}")
+
+    code = otps.issue("ravi")
+    print("Wrong code accepted?", otps.verify("ravi", "xxxx"))
+    print("Right code accepted?", otps.verify("ravi", code))
+    print("Reused code accepted?", otps.verify("ravi", code))
+    try:
+        for _ in range(5):
+            otps.issue("ravi")
+    except OTPThrottled as error:
+        print(f"{error}, retry in {error.retry_after:.0f}s")
@@ -0,0 +1,347 @@
+"""
+=============================================================================
+LUCKY 7 - MULTI-PLAYER GAME SERVER (asyncio)
+=============================================================================
+Runs Lucky 7 for many players at once over TCP, in one process.
+
+The game rules are not copied: "Lucky 7.py" is loaded as a module and its
+users, otps, create_user(), roll_dice() and process_bet() are
+used directly, so stats, the SQLite store, the event log and the
+leaderboard are the same ones the console game uses.
+
+Players sit at TABLES.  Every ROUND_SECONDS each table with open bets
+rolls the dice ONCE and settles every bet placed at it against that roll;
+the round's events are written to the event log before the next one.
+SIGINT / SIGTERM shut the server down cleanly (store and log flushed).
+
+Protocol - one JSON object per line, both directions:
+
+    {"cmd": "signup", "username": "ravi", "name": "Ravi"}   (also logs in)
+    {"cmd": "login", "username": "ravi"}        -> reply carries the OTP
+    {"cmd": "otp", "code": "4821"}
+    {"cmd": "join", "table": "main"}
+    {"cmd": "bet", "bet": "+7"}                 (+7 | -7 | ==7)
+    {"cmd": "stats"}
+    {"cmd": "top", "k": 10}
+    {"cmd": "leave"} / {"cmd": "quit"}
+
+Replies look like {"reply": "<cmd>", "ok": true, ...}; rolls arrive as
+{"event": "roll", "table": ..., "die1": ..., "die2": ..., "total": ...,
+"points": <your result or null>}.
+
+    python lucky7_server.py --port 7777
+    python lucky7_client.py --port 7777
+    python lucky7_loadgen.py --players 2000 --tables 20
+=============================================================================
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+import re
+import signal
+
+from lucky7_otp import OTPThrottled
+from lucky7_settlement import BETS
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+GAME_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lucky 7.py")
+ROUND_SECONDS = 2.0
+MAX_LINE = 4096                     # bytes per request line
+MAX_BUFFERED = 256 * 1024           # unsent bytes before a slow client is dropped
+MAX_TOP = 100
+USERNAME_PATTERN = re.compile(r"[A-Za-z0-9_.-]{1,32}")
+
+logger = logging.getLogger(__name__)
+
+
+def load_game():
+    """Import "Lucky 7.py" (its file name is not a valid module name)."""
+    spec = importlib.util.spec_from_file_location("lucky7_game", GAME_FILE)
+    game = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(game)
+    return game
+
+
+# =============================================================================
+# SESSIONS AND TABLES
+# =============================================================================
+
+class Session:
+    """One connected client."""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.username = None
+        self.pending_login = None       # username waiting for its OTP
+        self.table = None
+
+    def send(self, message: dict) -> None:
+        """Queue a message; drop the client if it stopped reading."""
+        if self.writer.is_closing():
+            return
+        if self.writer.transport.get_write_buffer_size() > MAX_BUFFERED:
+            self.writer.close()
+            return
+        self.writer.write((json.dumps(message) + "\n").encode())
+
+
+class Table:
+    """Players sharing one roll per round."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.members = {}       # username -> Session
+        self.bets = {}          # username -> bet for the coming roll
+        self.task = None
+
+
+class GameServer:
+    """Dispatches client commands and runs one round loop per table."""
+
+    def __init__(self, game, round_seconds: float = ROUND_SECONDS):
+        self.game = game
+        self.round_seconds = round_seconds
+        self.tables = {}
+        self.online = {}        # username -> Session
+
+    # -------------------------------------------------------------------------
+    # Connection handling
+    # -------------------------------------------------------------------------
+
+    async def handle(self, reader, writer) -> None:
+        session = Session(writer)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:          # line longer than MAX_LINE
+                    session.send({"ok": False, "error": "Request too long"})
+                    break
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    if not isinstance(message, dict):
+                        raise ValueError
+                except ValueError:
+                    session.send({"ok": False, "error": "Send one JSON object per line"})
+                    continue
+
+                reply = self.dispatch(session, message)
+                session.send(reply)
+                if message.get("cmd") == "quit":
+                    break
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.logout(session)
+            writer.close()
+
+    def dispatch(self, session: Session, message: dict) -> dict:
+        command = message.get("cmd")
+        handler = getattr(self, f"cmd_{command}", None) if isinstance(command, str) else None
+        if handler is None:
+            reply = {"ok": False, "error": f"Unknown command: {command}"}
+        elif command not in ("signup", "login", "otp", "quit") and session.username is None:
+            reply = {"ok": False, "error": "Please signup or login first"}
+        else:
+            reply = handler(session, message)
+        reply["reply"] = command
+        return reply
+
+    def logout(self, session: Session) -> None:
+        self.leave_table(session)
+        if session.username and self.online.get(session.username) is session:
+            del self.online[session.username]
+        session.username = None
+
+    def start_session(self, session: Session, username: str) -> None:
+        old = self.online.get(username)
+        if old is not None and old is not session:
+            old.send({"event": "logged_out", "reason": "Logged in from another connection"})
+            self.logout(old)
+            old.writer.close()
+        self.logout(session)
+        session.username = username
+        self.online[username] = session
+
+    # -------------------------------------------------------------------------
+    # Signup / login (same rules as the console game)
+    # -------------------------------------------------------------------------
+
+    def cmd_signup(self, session: Session, message: dict) -> dict:
+        username = str(message.get("username", "")).strip()
+        name = str(message.get("name", "")).strip()
+        if not username or not name:
+            return {"ok": False, "error": "Username and name are required"}
+        if not USERNAME_PATTERN.fullmatch(username):
+            return {"ok": False, "error": "Username must be 1-32 letters, digits, '_', '.' or '-'"}
+        if not self.game.create_user(username, name):
+            return {"ok": False, "error": "Username already exists. Please login."}
+        self.start_session(session, username)
+        return {"ok": True, "message": "Signup Successful!"}
+
+    def cmd_login(self, session: Session, message: dict) -> dict:
+        username = str(message.get("username", "")).strip()
+        if username not in self.game.users:
+            return {"ok": False, "error": "User not found. Please signup first."}
+        try:
+            otp = self.game.otps.issue(username)
+        except OTPThrottled as error:
+            return {"ok": False, "error": "Too many OTP requests",
+                    "retry_after": round(error.retry_after)}
+        session.pending_login = username
+        return {"ok": True, "otp": otp, "message": "Generated OTP, send it with the otp command"}
+
+    def cmd_otp(self, session: Session, message: dict) -> dict:
+        if session.pending_login is None:
+            return {"ok": False, "error": "Login first"}
+        username = session.pending_login
+        if not self.game.otps.verify(username, str(message.get("code", ""))):
+            return {"ok": False, "error": "Invalid OTP!"}
+        session.pending_login = None
+        self.start_session(session, username)
+        return {"ok": True, "message": "Login Successful!"}
+
+    def cmd_quit(self, session: Session, message: dict) -> dict:
+        return {"ok": True, "message": "Logging out..."}
+
+    # -------------------------------------------------------------------------
+    # Tables and bets
+    # -------------------------------------------------------------------------
+
+    def cmd_join(self, session: Session, message: dict) -> dict:
+        name = str(message.get("table", "main")).strip() or "main"
+        self.leave_table(session)
+        table = self.tables.get(name)
+        if table is None:
+            table = self.tables[name] = Table(name)
+            table.task = asyncio.get_running_loop().create_task(self.run_table(table))
+        table.members[session.username] = session
+        session.table = table
+        return {"ok": True, "table": name, "players": len(table.members)}
+
+    def cmd_leave(self, session: Session, message: dict) -> dict:
+        self.leave_table(session)
+        return {"ok": True}
+
+    def leave_table(self, session: Session) -> None:
+        table = session.table
+        if table is None:
+            return
+        if table.members.get(session.username) is session:
+            del table.members[session.username]
+            table.bets.pop(session.username, None)
+        session.table = None
+
+    def cmd_bet(self, session: Session, message: dict) -> dict:
+        bet = message.get("bet")
+        if session.table is None:
+            return {"ok": False, "error": "Join a table first"}
+        if bet not in BETS:
+            return {"ok": False, "error": "Invalid Bet! Use " + ", ".join(BETS)}
+        session.table.bets[session.username] = bet
+        return {"ok": True, "bet": bet}
+
+    def cmd_stats(self, session: Session, message: dict) -> dict:
+        stats = dict(self.game.users[session.username])
+        stats["rank"] = self.game.leaderboard.rank(session.username)
+        stats["players"] = len(self.game.leaderboard)
+        return {"ok": True, "stats": stats}
+
+    def cmd_top(self, session: Session, message: dict) -> dict:
+        try:
+            k = max(1, min(MAX_TOP, int(message.get("k", 10))))
+        except (TypeError, ValueError):
+            return {"ok": False, "error": "k must be a number"}
+        return {"ok": True, "top": self.game.leaderboard.top(k)}
+
+    async def run_table(self, table: Table) -> None:
+        """Roll once per round for everyone at the table; stop when it empties."""
+        try:
+            while table.members:
+                await asyncio.sleep(self.round_seconds)
+                if not table.bets:
+                    continue
+                bets, table.bets = table.bets, {}
+                try:
+                    self.play_round(table, bets)
+                except Exception:
+                    logger.exception("Table %s: round failed", table.name)
+        finally:
+            if self.tables.get(table.name) is table:
+                del self.tables[table.name]
+
+    def play_round(self, table: Table, bets: dict) -> None:
+        """One roll for the table; a failure for one player does not stop the others."""
+        die1, die2 = self.game.roll_dice()
+        total = die1 + die2
+        roll = {"event": "roll", "table": table.name,
+                "die1": die1, "die2": die2, "total": total}
+        for username, session in list(table.members.items()):
+            bet = bets.get(username)
+            points = None
+            try:
+                if bet:
+                    points = self.game.process_bet(bet, total, username)
+                    self.game.events.append(username, bet, die1, die2, points)
+                session.send(dict(roll, bet=bet, points=points))
+            except Exception:
+                logger.exception("Table %s: could not settle %r for %s",
+                                 table.name, bet, username)
+        # The round is in SQLite's write-behind buffer; put it in the log too
+        self.game.events.flush()
+
+
+# =============================================================================
+# ENTRY POINT
+# =============================================================================
+
+async def serve(host: str, port: int, round_seconds: float) -> None:
+    game = load_game()
+    server = GameServer(game, round_seconds)
+    listener = await asyncio.start_server(server.handle, host, port, limit=MAX_LINE)
+    print(f"Lucky 7 server listening on {host}:{port} "
+          f"({len(game.users)} users, {round_seconds}s rounds)")
+    # SIGINT/SIGTERM stop the server cleanly, so the store and the event
+    # log are flushed and closed (add_signal_handler is Unix-only)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop.set)
+        except (NotImplementedError, AttributeError):
+            pass
+    try:
+        async with listener:
+            await stop.wait()
+    finally:
+        game.store.close()
+        game.events.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Multi-player Lucky 7 server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--round-seconds", type=float, default=ROUND_SECONDS)
+    args = parser.parse_args()
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(message)s")
+    try:
+        asyncio.run(serve(args.host, args.port, args.round_seconds))
+    except KeyboardInterrupt:
+        pass
+    print("\nServer stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+=============================================================================
+LUCKY 7 - TABLE-DRIVEN BET SETTLEMENT
+=============================================================================
+Every bet is a row in a payout table indexed by (bet code, dice total):
+
+              total:  0  1  2  3  4  5  6   7   8  9 10 11 12
+    +7   (code 0)     .  . -5 -5 -5 -5 -5  -5  10 10 10 10 10
+    -7   (code 1)     .  . 10 10 10 10 10  -5  -5 -5 -5 -5 -5
+    ==7  (code 2)     .  . -5 -5 -5 -5 -5  20  -5 -5 -5 -5 -5
+
+Settling a bet is one lookup, and a whole batch of bets is one gather
+over the flattened table (a single NumPy fancy-index when NumPy is
+installed).  The same table drives the console game (process_bet), the
+network server, lucky7_simulator.py and log replay.
+
+To add a bet type, add one line to BET_RULES - nothing else changes.
+=============================================================================
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+WIN_POINTS = 10
+JACKPOT_POINTS = 20
+LOSE_POINTS = -5
+DICE_MIN = 1
+DICE_MAX = 6
+TOTAL_SLOTS = 2 * DICE_MAX + 1      # totals 0..12 index the table directly
+
+# bet -> (wins when the total ..., points on a win); a loss is LOSE_POINTS
+BET_RULES = {
+    "+7": (lambda total: total > 7, WIN_POINTS),
+    "-7": (lambda total: total < 7, WIN_POINTS),
+    "==7": (lambda total: total == 7, JACKPOT_POINTS),
+}
+
+
+# =============================================================================
+# PAYOUT TABLE
+# =============================================================================
+
+BETS = list(BET_RULES)
+BET_CODES = {bet: code for code, bet in enumerate(BETS)}
+
+PAYOUTS = [
+    [(points if wins(total) else LOSE_POINTS) if total >= 2 * DICE_MIN else 0
+     for total in range(TOTAL_SLOTS)]
+    for wins, points in BET_RULES.values()
+]
+# Row-major copy: entry for (code, total) is FLAT_PAYOUTS[code * TOTAL_SLOTS + total]
+FLAT_PAYOUTS = [points for row in PAYOUTS for points in row]
+PAYOUT_ARRAY = np.array(PAYOUTS, dtype=np.int64) if np is not None else None
+
+
+def _bad_total(total) -> ValueError:
+    return ValueError(f"Dice total must be {2 * DICE_MIN}..{2 * DICE_MAX}, got {total!r}")
+
+
+def settle(bet: str, total: int) -> int:
+    """Points won (positive) or lost (negative) by one bet."""
+    if not 2 * DICE_MIN <= total <= 2 * DICE_MAX:
+        raise _bad_total(total)
+    try:
+        return PAYOUTS[BET_CODES[bet]][total]
+    except KeyError:
+        raise ValueError(f"Unknown bet: {bet}") from None
+
+
+def settle_batch(codes, totals):
+    """
+    Settle many bets at once.
+
+    Args:
+        codes: bet codes (BET_CODES values), list or NumPy array
+        totals: dice totals, same length
+
+    Returns:
+        Points per bet (NumPy array if NumPy is installed, else a list)
+
+    Raises:
+        ValueError: for an unknown bet code or a total outside 2..12,
+            like settle()
+    """
+    low, high = 2 * DICE_MIN, 2 * DICE_MAX
+    if np is not None:
+        codes = np.asarray(codes, dtype=np.intp)
+        totals = np.asarray(totals, dtype=np.intp)
+        bad = (codes < 0) | (codes >= len(BETS))
+        if bad.any():
+            raise ValueError(f"Unknown bet code: {codes[bad][0]}")
+        bad = (totals < low) | (totals > high)
+        if bad.any():
+            raise _bad_total(int(totals[bad][0]))
+        return PAYOUT_ARRAY[codes, totals]
+    flat = FLAT_PAYOUTS
+    points = []
+    for code, total in zip(codes, totals):
+        if not 0 <= code < len(BETS):
+            raise ValueError(f"Unknown bet code: {code}")
+        if not low <= total <= high:
+            raise _bad_total(total)
+        points.append(flat[code * TOTAL_SLOTS + total])
+    return points
+
+
+def apply_results(users: dict, usernames, points) -> None:
+    """
+    Add settled bets to the users dict ({username: {"wins", "losses", "score"}}).
+
+    Results are summed per user first, so each user's record is touched once
+    per batch rather than once per bet.
+    """
+    totals = {}
+    for username, value in zip(usernames, points):
+        value = int(value)
+        wins, losses, score = totals.get(username, (0, 0, 0))
+        if value > 0:
+            wins += 1
+        else:
+            losses += 1
+        totals[username] = (wins, losses, score + value)
+
+    for username, (wins, losses, score) in totals.items():
+        stats = users[username]
+        stats["wins"] += wins
+        stats["losses"] += losses
+        stats["score"] += score
+
+
+def replay(records, users: dict) -> int:
+    """
+    Re-settle recorded games and add them to users.
+
+    Args:
+        records: iterable of (username, bet, die1, die2)
+        users: users dict to update (missing users start from zero)
+
+    Returns:
+        Number of bets replayed
+
+    Raises:
+        ValueError: for an unknown bet or an impossible roll (users is
+            left unchanged)
+    """
+    usernames, codes, totals = [], [], []
+    for username, bet, die1, die2 in records:
+        if bet not in BET_CODES:
+            raise ValueError(f"Unknown bet: {bet}")
+        usernames.append(username)
+        codes.append(BET_CODES[bet])
+        totals.append(die1 + die2)
+    # Settle (and validate) everything before users is touched
+    points = settle_batch(codes, totals)
+    for username in usernames:
+        if username not in users:
+            users[username] = {"name": username, "wins": 0, "losses": 0, "score": 0}
+    apply_results(users, usernames, points)
+    return len(usernames)
+
+
+if __name__ == "__main__":
+    print("Payout table (rows: bets, columns: totals 2-12)")
+    print("       " + " ".join(f"{t:4}" for t in range(2, TOTAL_SLOTS)))
+    for bet, row in zip(BETS, PAYOUTS):
+        print(f"{bet:6} " + " ".join(f"{p:4}" for p in row[2:]))
@@ -0,0 +1,177 @@
+"""
+=============================================================================
+LUCKY 7 - MONTE CARLO STRATEGY SIMULATOR
+=============================================================================
+Plays millions of Lucky 7 rounds at once, without the console, and reports
+for each bet (+7, -7, ==7):
+
+  * expected points per round and its variance (simulated and exact)
+  * win rate
+  * the distribution of a player's final score after N rounds
+
+Dice are rolled in whole batches: with NumPy installed one call produces
+millions of rolls as an int8 array and bets are settled with array
+gathers from the payout table in lucky7_settlement.py; without NumPy the
+totals are drawn with random.choices() using the 2-dice weights and
+settled through the same table.
+
+    python lucky7_simulator.py --players 10000 --rounds 100
+    python lucky7_simulator.py --players 100000 --rounds 50 --json
+=============================================================================
+"""
+
+import argparse
+import json
+import random
+import statistics
+
+from lucky7_settlement import (BETS, BET_CODES, DICE_MAX, DICE_MIN, FLAT_PAYOUTS,
+                               PAYOUT_ARRAY, TOTAL_SLOTS, np, settle)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+TOTALS = list(range(2 * DICE_MIN, 2 * DICE_MAX + 1))
+TOTAL_WEIGHTS = [6 - abs(total - 7) for total in TOTALS]   # ways to roll each total
+BATCH_SIZE = 5_000_000          # rolls generated per NumPy call
+
+
+# =============================================================================
+# BET STATISTICS
+# =============================================================================
+
+def exact_stats(bet: str) -> tuple:
+    """Exact (mean, variance) of one round, from the 36 equally likely rolls."""
+    outcomes = 36
+    mean = sum(w * settle(bet, t) for t, w in zip(TOTALS, TOTAL_WEIGHTS)) / outcomes
+    square = sum(w * settle(bet, t) ** 2 for t, w in zip(TOTALS, TOTAL_WEIGHTS)) / outcomes
+    return mean, square - mean ** 2
+
+
+def _check_sizes(players: int, rounds: int) -> None:
+    if players <= 0 or rounds <= 0:
+        raise ValueError(f"players and rounds must be positive (got {players}, {rounds})")
+
+
+# =============================================================================
+# BATCHED ROLLING
+# =============================================================================
+
+def roll_totals_numpy(rng, count: int):
+    """Roll `count` pairs of dice; return their totals as an int8 array."""
+    dice = rng.integers(DICE_MIN, DICE_MAX + 1, size=(2, count), dtype=np.int8)
+    return dice[0] + dice[1]
+
+
+def simulate_numpy(bet: str, players: int, rounds: int, seed: int) -> tuple:
+    """Return (final scores per player, wins) using NumPy batches."""
+    _check_sizes(players, rounds)
+    rng = np.random.default_rng(seed)
+    table = PAYOUT_ARRAY[BET_CODES[bet]]
+    finals = np.zeros(players, dtype=np.int64)
+    wins = 0
+    # Whole players per batch keeps each row of the reshape inside one batch
+    per_batch = max(1, BATCH_SIZE // rounds)
+    for first in range(0, players, per_batch):
+        count = min(per_batch, players - first)
+        totals = roll_totals_numpy(rng, count * rounds)
+        points = table[totals].reshape(count, rounds)
+        finals[first:first + count] = points.sum(axis=1)
+        wins += int((points > 0).sum())
+    return finals.tolist(), wins
+
+
+def simulate_python(bet: str, players: int, rounds: int, seed: int) -> tuple:
+    """Return (final scores per player, wins) with the standard library only."""
+    _check_sizes(players, rounds)
+    rng = random.Random(seed)
+    first = BET_CODES[bet] * TOTAL_SLOTS
+    table = FLAT_PAYOUTS[first:first + TOTAL_SLOTS]
+    finals = []
+    wins = 0
+    for _ in range(players):
+        totals = rng.choices(TOTALS, weights=TOTAL_WEIGHTS, k=rounds)
+        points = [table[total] for total in totals]
+        finals.append(sum(points))
+        wins += sum(1 for p in points if p > 0)
+    return finals, wins
+
+
+def simulate(bet: str, players: int, rounds: int, seed: int = 0) -> dict:
+    """Play `players` x `rounds` games with one fixed bet and summarise them."""
+    runner = simulate_numpy if np is not None else simulate_python
+    finals, wins = runner(bet, players, rounds, seed)
+
+    games = players * rounds
+    mean = sum(finals) / games
+    exact_mean, exact_variance = exact_stats(bet)
+    ordered = sorted(finals)
+
+    def percentile(p: float) -> int:
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+    return {
+        "bet": bet,
+        "games": games,
+        "win_rate": wins / games,
+        "mean_per_round": mean,
+        # Rounds are independent, so per-round variance = final-score variance / rounds
+        "variance_per_round": (statistics.pvariance(finals) / rounds) if players > 1 else None,
+        "exact_mean_per_round": exact_mean,
+        "exact_variance_per_round": exact_variance,
+        "final_score": {
+            "rounds": rounds,
+            "mean": sum(finals) / players,
+            "min": ordered[0],
+            "p5": percentile(0.05),
+            "p50": percentile(0.50),
+            "p95": percentile(0.95),
+            "max": ordered[-1],
+            "share_positive": sum(1 for f in finals if f > 0) / players,
+        },
+    }
+
+
+def compare_strategies(players: int, rounds: int, seed: int = 0) -> list:
+    """Simulate every bet with the same settings."""
+    return [simulate(bet, players, rounds, seed) for bet in BETS]
+
+
+# =============================================================================
+# ENTRY POINT
+# =============================================================================
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Monte Carlo analysis of Lucky 7 bets.")
+    parser.add_argument("--players", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=100, help="rounds per player")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the raw report as JSON")
+    args = parser.parse_args()
+
+    try:
+        report = compare_strategies(args.players, args.rounds, args.seed)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    engine = "NumPy" if np is not None else "pure Python"
+    print(f"\n{'=' * 70}")
+    print(f"  LUCKY 7 SIMULATION - {args.players} players x {args.rounds} rounds ({engine})")
+    print(f"{'=' * 70}")
+    print(f"{'Bet':5} {'Win %':>7} {'EV/round':>9} {'exact':>7} {'Var':>8} "
+          f"{'p5':>6} {'p50':>6} {'p95':>6}")
+    for row in report:
+        final = row["final_score"]
+        variance = row["variance_per_round"]
+        print(f"{row['bet']:5} {row['win_rate'] * 100:7.2f} {row['mean_per_round']:9.3f} "
+              f"{row['exact_mean_per_round']:7.3f} {variance if variance is not None else 0:8.2f} "
+              f"{final['p5']:6} {final['p50']:6} {final['p95']:6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+=============================================================================
+LUCKY 7 - PERSISTENT USER STORE (SQLite, write-behind)
+=============================================================================
+Keeps Lucky 7 users and their wins / losses / score in a SQLite file so
+they survive a restart.
+
+  * Signups are written (and committed) immediately - they are rare.
+  * Stat changes are only buffered in memory: the latest values per user
+    replace each other, so 50 rolls by one player become one row update.
+  * The buffer is flushed in a single transaction when FLUSH_THRESHOLD
+    users are dirty, every FLUSH_INTERVAL seconds from a background
+    thread, and on close().  A batch that fails to write goes back into
+    the buffer and is retried with the next flush.
+
+The database runs in WAL mode with synchronous=NORMAL, so a flush costs
+one sequential log write instead of an fsync per dice roll.  At most the
+last FLUSH_INTERVAL seconds of stats can be lost if the process is killed.
+
+    store = UserStore("lucky7.db")
+    users = store.load_users()
+    store.add_user("ravi", "Ravi")
+    store.save_stats("ravi", users["ravi"])
+    store.close()
+=============================================================================
+"""
+
+import logging
+import sqlite3
+import threading
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+FLUSH_INTERVAL = 2.0        # seconds between background flushes
+FLUSH_THRESHOLD = 500       # dirty users that trigger an immediate flush
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    name     TEXT NOT NULL,
+    wins     INTEGER NOT NULL DEFAULT 0,
+    losses   INTEGER NOT NULL DEFAULT 0,
+    score    INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+class UserStore:
+    """SQLite-backed user table with buffered (write-behind) stat updates."""
+
+    def __init__(self, path: str, flush_interval: float = FLUSH_INTERVAL,
+                 flush_threshold: int = FLUSH_THRESHOLD):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(SCHEMA)
+        self.conn.commit()
+
+        self.flush_threshold = flush_threshold
+        self.pending = {}                   # username -> (wins, losses, score)
+        self.pending_lock = threading.Lock()
+        self.db_lock = threading.Lock()
+
+        self.stopped = threading.Event()
+        self.flusher = None
+        if flush_interval:
+            self.flusher = threading.Thread(target=self._flush_loop, args=(flush_interval,),
+                                            daemon=True)
+            self.flusher.start()
+
+    # -------------------------------------------------------------------------
+    # Reads and signups (write-through)
+    # -------------------------------------------------------------------------
+
+    def load_users(self) -> dict:
+        """Return every user in the game's {username: {...}} format."""
+        self.flush()
+        with self.db_lock:
+            rows = self.conn.execute(
+                "SELECT username, name, wins, losses, score FROM users").fetchall()
+        return {username: {"name": name, "wins": wins, "losses": losses, "score": score}
+                for username, name, wins, losses, score in rows}
+
+    def add_user(self, username: str, name: str) -> bool:
+        """Create a user; return False if the username is already taken."""
+        with self.db_lock:
+            try:
+                with self.conn:
+                    self.conn.execute("INSERT INTO users (username, name) VALUES (?, ?)",
+                                      (username, name))
+            except sqlite3.IntegrityError:
+                return False
+        return True
+
+    # -------------------------------------------------------------------------
+    # Buffered stat updates
+    # -------------------------------------------------------------------------
+
+    def save_stats(self, username: str, stats: dict) -> None:
+        """Queue the user's current wins/losses/score for the next flush."""
+        with self.pending_lock:
+            self.pending[username] = (stats["wins"], stats["losses"], stats["score"])
+            full = len(self.pending) >= self.flush_threshold
+        if full:
+            try:
+                self.flush()
+            except sqlite3.Error:
+                # The updates stay buffered; the next flush retries them
+                logger.exception("Lucky 7 store: flush failed")
+
+    def flush(self) -> int:
+        """Write every buffered update in one transaction; return rows written."""
+        # Holding db_lock across the swap keeps batches in order: an older
+        # batch can never be written after a newer one
+        with self.db_lock:
+            with self.pending_lock:
+                if not self.pending:
+                    return 0
+                batch, self.pending = self.pending, {}
+
+            rows = [(wins, losses, score, username)
+                    for username, (wins, losses, score) in batch.items()]
+            try:
+                with self.conn:
+                    self.conn.executemany(
+                        "UPDATE users SET wins = ?, losses = ?, score = ? WHERE username = ?",
+                        rows)
+            except BaseException:
+                # Put the batch back; values saved since the swap are newer
+                with self.pending_lock:
+                    batch.update(self.pending)
+                    self.pending = batch
+                raise
+        return len(rows)
+
+    def _flush_loop(self, interval: float) -> None:
+        while not self.stopped.wait(interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Lucky 7 store: background flush failed")
+
+    def close(self) -> None:
+        """Stop the background flusher, write what is left and close the file."""
+        self.stopped.set()
+        if self.flusher is not None:
+            self.flusher.join()
+        self.flush()
+        with self.db_lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+
+    path = os.path.join(tempfile.mkdtemp(), "lucky7_demo.db")
+    with UserStore(path) as store:
+        users = {}
+        for i in range(1000):
+            username = f"player{i}"
+            store.add_user(username, f"Player {i}")
+            users[username] = {"name": f"Player {i}", "wins": 0, "losses": 0, "score": 0}
+
+        start = time.perf_counter()
+        for _ in range(200_000):
+            username = f"player{random.randrange(1000)}"
+            users[username]["wins"] += 1
+            users[username]["score"] += 10
+            store.save_stats(username, users[username])
+        print(f"200000 updates buffered in {time.perf_counter() - start:.2f}s")
+
+    with UserStore(path) as store:
+        reloaded = store.load_users()
+        print("Reloaded matches memory:", reloaded == users)
@@ -0,0 +1,253 @@
+"""
+=============================================================================
+BOUNDED, THREAD-SAFE MEMOIZATION
+=============================================================================
+memoize() in Functions_notes.py / Nested_Functions.py keeps every result
+forever in a dict keyed by *args: keyword arguments are not supported,
+two threads can compute the same value at once, and a long-running
+service slowly fills its memory with stale results.
+
+@memoize(...) below fixes that:
+
+  * LRU eviction once `maxsize` entries or `maxbytes` bytes are cached
+    (result sizes measured with `sizeof`, sys.getsizeof by default);
+  * optional `ttl`: entries older than ttl seconds are recomputed;
+  * keys are built from the call bound to the function's signature, so
+    f(1, offset=1), f(offset=1, n=1) and f(1, 1) share an entry, and so
+    do f(1) and f(1, offset=0) when 0 is the default;
+  * per-key locks: when many threads miss on the same key, one computes
+    and the others wait for its result (no thundering herd), while
+    different keys are computed in parallel;
+  * hits / misses / evictions / expirations counters via cache_info().
+
+Exceptions are not cached.
+
+    @memoize(maxsize=10_000, ttl=300)
+    def price(symbol, currency="INR"): ...
+
+    price.cache_info()      # CacheInfo(hits=..., misses=..., ...)
+    price.cache_clear()
+=============================================================================
+"""
+
+import inspect
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+DEFAULT_MAXSIZE = 1024
+_KWARGS_MARK = object()             # separates positional from keyword args in a key
+
+CacheInfo = namedtuple(
+    "CacheInfo", "hits misses evictions expirations currsize currbytes maxsize maxbytes")
+
+
+def make_key(args: tuple, kwargs: dict):
+    """Hashable key for already-normalised arguments; keyword order does not matter."""
+    if not kwargs:
+        return args[0] if len(args) == 1 and type(args[0]) in (int, str) else args
+    return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+
+def key_maker(func):
+    """
+    Return key(args, kwargs) for calls to func: arguments are bound to its
+    signature with defaults applied, so equivalent calls give equal keys.
+    """
+    try:
+        signature = inspect.signature(func)
+    except (TypeError, ValueError):
+        return make_key                 # no signature (some builtins): as given
+
+    params = signature.parameters.values()
+    plain = all(p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD) for p in params)
+    arity = len(signature.parameters)
+
+    def key(args: tuple, kwargs: dict):
+        if plain and not kwargs and len(args) == arity:
+            return make_key(args, kwargs)   # already complete; skip binding
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return make_key(bound.args, bound.kwargs)
+
+    return key
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class BoundedCache:
+    """LRU (+ optional TTL) store shared by all threads calling one function."""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, maxbytes=None, ttl=None,
+                 sizeof=sys.getsizeof, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.clock = clock
+
+        self.entries = OrderedDict()    # key -> (value, size, stored_at)
+        self.lock = threading.Lock()    # guards entries, counters and key_locks
+        self.key_locks = {}             # key -> [lock, threads using it]
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def lookup(self, key):
+        """(True, value) on a fresh hit, else (False, None).  Caller holds self.lock."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return False, None
+        value, size, stored_at = entry
+        if self.ttl is not None and self.clock() - stored_at >= self.ttl:
+            del self.entries[key]
+            self.bytes -= size
+            self.expirations += 1
+            return False, None
+        self.entries.move_to_end(key)
+        return True, value
+
+    def store(self, key, value) -> None:
+        """Caller holds self.lock."""
+        size = self.sizeof(value) if self.maxbytes is not None else 0
+        if self.maxbytes is not None and size > self.maxbytes:
+            return                      # would evict everything and still not fit
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        self.entries[key] = (value, size, self.clock())
+        self.bytes += size
+        while ((self.maxsize is not None and len(self.entries) > self.maxsize)
+               or (self.maxbytes is not None and self.bytes > self.maxbytes)):
+            _, (_, old_size, _) = self.entries.popitem(last=False)
+            self.bytes -= old_size
+            self.evictions += 1
+
+    def get_or_compute(self, key, func, args, kwargs):
+        with self.lock:
+            found, value = self.lookup(key)
+            if found:
+                self.hits += 1
+                return value
+            slot = self.key_locks.get(key)
+            if slot is None:
+                slot = self.key_locks[key] = [threading.Lock(), 0]
+            slot[1] += 1
+
+        try:
+            with slot[0]:
+                # Another thread may have filled the entry while we waited
+                with self.lock:
+                    found, value = self.lookup(key)
+                    if found:
+                        self.hits += 1
+                        return value
+                    self.misses += 1
+                value = func(*args, **kwargs)
+                with self.lock:
+                    self.store(key, value)
+                return value
+        finally:
+            with self.lock:
+                slot[1] -= 1
+                if slot[1] == 0:
+                    del self.key_locks[key]
+
+    def info(self) -> CacheInfo:
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.expirations,
+                             len(self.entries), self.bytes, self.maxsize, self.maxbytes)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+
+# =============================================================================
+# DECORATOR
+# =============================================================================
+
+def memoize(function=None, *, maxsize=DEFAULT_MAXSIZE, maxbytes=None, ttl=None,
+            sizeof=sys.getsizeof):
+    """
+    Cache a function's results.
+
+    Args:
+        maxsize: most entries kept (None = no entry limit)
+        maxbytes: most bytes of results kept, as measured by sizeof
+            (None = no byte limit)
+        ttl: seconds an entry stays valid (None = until evicted)
+        sizeof: function returning the size of a result in bytes
+
+    Can be used bare (@memoize) or with options (@memoize(maxsize=100)).
+    """
+    def decorator(func):
+        cache = BoundedCache(maxsize, maxbytes, ttl, sizeof)
+
+        normalise = key_maker(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return cache.get_or_compute(normalise(args, kwargs), func, args, kwargs)
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator(function) if function is not None else decorator
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    calls = []
+
+    @memoize(maxsize=3)
+    def slow_square(n, offset=0):
+        calls.append(n)
+        time.sleep(0.2)
+        return n * n + offset
+
+    # 20 threads ask for the same key at once: computed only once
+    with ThreadPoolExecutor(20) as pool:
+        results = list(pool.map(lambda _: slow_square(7), range(20)))
+    print("20 concurrent calls ->", set(results), "computed", calls.count(7), "time(s)")
+
+    slow_square(1, offset=1)
+    slow_square(offset=1, n=1)          # same key as the line above
+    for n in range(2, 6):
+        slow_square(n)
+    print(slow_square.cache_info())
+
+    @memoize(maxsize=None)
+    def fibonacci(n):
+        return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+    # Each level of recursion is 3 frames here, so stay well below the limit
+    print("fibonacci(250) =", fibonacci(250))
+    print(fibonacci.cache_info())
+
+    @memoize(maxbytes=10_000, maxsize=None)
+    def block(n):
+        return bytes(n)
+
+    for n in range(0, 5000, 100):
+        block(n)
+    info = block.cache_info()
+    print(f"byte-limited cache: {info.currsize} entries, {info.currbytes} bytes, "
+          f"{info.evictions} evictions")
@@ -0,0 +1,329 @@
+"""
+=============================================================================
+STREAMING MISSING / DUPLICATE NUMBER DETECTION
+=============================================================================
+Jan_21.py finds the missing number of 1..n with
+
+    series = list(map(int, input().split()))
+    n * (n + 1) // 2 - sum(series)
+
+so the whole series is one list in memory (about 36 bytes per number,
+36 GB for a billion) and only a single missing value can be found.
+
+Here numbers are read from a file or stdin in fixed-size chunks and
+folded into small summaries in one pass:
+
+  * signature(chunks)      - count, sum, sum of squares, xor, min, max.
+                             Constant memory whatever the length.
+  * missing_one(...)       - one number missing from 1..n: the xor of
+                             1..n with the xor of the series; the sum is
+                             checked too, so a series that does not fit
+                             the assumption raises ValueError.
+  * missing_and_duplicate  - one number replaced by a copy of another:
+                             with D the duplicate and M the missing one,
+                             sum gives D - M and the sum of squares gives
+                             D^2 - M^2 = (D - M)(D + M).
+  * scan_bitmap(...)       - any number of missing and duplicated values:
+                             a "seen" bitmap and a "seen twice" bitmap of
+                             n bits each, n/4 bytes in total (250 MB for a
+                             billion).  With NumPy installed whole chunks
+                             are parsed and marked at once.
+
+Malformed input (a token that is not an integer) raises ValueError on
+either path, and so does a number outside int64 on the NumPy path.
+
+    python missing_numbers.py numbers.txt              # one missing value
+    python missing_numbers.py numbers.txt --bitmap     # every missing/duplicate
+    seq 1 1000000 | grep -vx 4242 | python missing_numbers.py
+=============================================================================
+"""
+
+import argparse
+import operator
+import re
+import sys
+import warnings
+from collections import namedtuple
+from functools import reduce
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+CHUNK_BYTES = 1 << 20           # bytes of text parsed at a time
+
+if np is not None:
+    # Byte classes for _parse_numpy(): 1 = whitespace (as bytes.split()), 2 = digit, 3 = sign
+    _BYTE_CLASS = np.zeros(256, dtype=np.uint8)
+    _BYTE_CLASS[np.frombuffer(b" \t\n\r\x0b\x0c", dtype=np.uint8)] = 1
+    _BYTE_CLASS[np.frombuffer(b"0123456789", dtype=np.uint8)] = 2
+    _BYTE_CLASS[np.frombuffer(b"+-", dtype=np.uint8)] = 3
+    _INT64 = np.iinfo(np.int64)
+
+Signature = namedtuple("Signature", "count total squares xor low high")
+ScanResult = namedtuple("ScanResult", "count missing duplicates out_of_range")
+
+
+def xor_upto(n: int) -> int:
+    """1 ^ 2 ^ ... ^ n in O(1) (the pattern repeats every 4)."""
+    return (n, 1, n + 1, 0)[n % 4] if n > 0 else 0
+
+
+# =============================================================================
+# READING
+# =============================================================================
+
+def read_chunks(source=None, chunk_bytes: int = CHUNK_BYTES, as_array: bool = False):
+    """
+    Yield lists of the integers in `source` (a path, a binary or text file,
+    or stdin when None), CHUNK_BYTES of text at a time.  as_array=True
+    yields int64 NumPy arrays instead.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as stream:
+            yield from read_chunks(stream, chunk_bytes, as_array)
+        return
+    stream = sys.stdin.buffer if source is None else getattr(source, "buffer", source)
+    tail = b""
+    while True:
+        block = stream.read(chunk_bytes)
+        if not block:
+            break
+        if isinstance(block, str):
+            block = block.encode()
+        block = tail + block
+        # A number may be cut in two at the end of the block: keep it for later
+        cut = max(block.rfind(b" "), block.rfind(b"\n"), block.rfind(b"\t"),
+                  block.rfind(b","), block.rfind(b"\r"))
+        if cut < 0:
+            tail = block
+            continue
+        block, tail = block[:cut], block[cut + 1:]
+        chunk = _parse(block, as_array)
+        if len(chunk):
+            yield chunk
+    chunk = _parse(tail, as_array)
+    if len(chunk):
+        yield chunk
+
+
+def _parse(block: bytes, as_array: bool):
+    block = block.replace(b",", b" ")
+    if as_array:
+        return _parse_numpy(block)
+    return list(map(int, block.split()))
+
+
+def _parse_numpy(block: bytes):
+    """
+    int64 array of the whitespace-separated integers in block, parsed in C.
+    np.fromstring() can stop early, reads a blank block or a lone sign as 0
+    and saturates on overflow without saying so, so the block is checked
+    with vectorised byte classes (only digits, signs and whitespace, one
+    run of digits per token) and the result against the token count and
+    the int64 limits.  A chunk that fails is parsed again with int(), which
+    names the bad token.
+    """
+    classes = _BYTE_CLASS[np.frombuffer(block, dtype=np.uint8)]
+    if not classes.size:
+        return np.empty(0, dtype=np.int64)
+    space = classes == 1
+    digit = classes == 2
+    # Tokens start at a non-space byte after a space; digit runs likewise
+    tokens = int(np.count_nonzero(space[:-1] & ~space[1:])) + (not space[0])
+    runs = int(np.count_nonzero(~digit[:-1] & digit[1:])) + bool(digit[0])
+    if not tokens:
+        return np.empty(0, dtype=np.int64)
+    if runs != tokens or not classes.all():
+        return _parse_strict(block)
+    try:
+        with warnings.catch_warnings():
+            # NumPy < 2 only warns when it cannot read to the end
+            warnings.simplefilter("ignore", DeprecationWarning)
+            values = np.fromstring(block, dtype=np.int64, sep=" ")
+    except ValueError:
+        values = None
+    if (values is None or values.size != tokens
+            or values.min() == _INT64.min or values.max() == _INT64.max):
+        return _parse_strict(block)
+    return values
+
+
+def _parse_strict(block: bytes):
+    # int() raises ValueError naming a malformed token; int64 overflow is a ValueError too
+    values = list(map(int, block.split()))
+    try:
+        return np.array(values, dtype=np.int64)
+    except OverflowError:
+        raise ValueError("number outside the int64 range in input") from None
+
+
+# =============================================================================
+# SIGNATURES (constant memory)
+# =============================================================================
+
+def signature(chunks) -> Signature:
+    count = total = squares = xor = 0
+    low = high = None
+    for chunk in chunks:
+        if not len(chunk):
+            continue
+        count += len(chunk)
+        total += sum(chunk)
+        squares += sum(value * value for value in chunk)
+        xor = reduce(operator.xor, chunk, xor)
+        chunk_low, chunk_high = min(chunk), max(chunk)
+        low = chunk_low if low is None else min(low, chunk_low)
+        high = chunk_high if high is None else max(high, chunk_high)
+    return Signature(count, total, squares, xor, low, high)
+
+
+def missing_one(chunks, n: int = None) -> int:
+    """The one number of 1..n absent from the series (n defaults to count + 1)."""
+    sig = signature(chunks)
+    n = sig.count + 1 if n is None else n
+    if sig.count != n - 1:
+        raise ValueError(f"expected {n - 1} numbers for one missing value, got {sig.count}")
+    missing = xor_upto(n) ^ sig.xor
+    if n * (n + 1) // 2 - sig.total != missing or not 1 <= missing <= n:
+        raise ValueError("the series is not 1..n with exactly one number missing")
+    return missing
+
+
+def missing_and_duplicate(chunks, n: int = None) -> tuple:
+    """
+    (missing, duplicate) for 1..n where one number was replaced by a
+    copy of another (n defaults to the count).
+    """
+    sig = signature(chunks)
+    n = sig.count if n is None else n
+    if sig.count != n:
+        raise ValueError(f"expected {n} numbers, got {sig.count}")
+    diff = sig.total - n * (n + 1) // 2                         # D - M
+    square_diff = sig.squares - n * (n + 1) * (2 * n + 1) // 6  # D^2 - M^2
+    if diff == 0 or square_diff % diff:
+        raise ValueError("the series is not 1..n with one number replaced")
+    both = square_diff // diff                                  # D + M
+    duplicate, remainder = divmod(both + diff, 2)
+    missing = both - duplicate
+    if remainder or not (1 <= missing <= n and 1 <= duplicate <= n):
+        raise ValueError("the series is not 1..n with one number replaced")
+    return missing, duplicate
+
+
+# =============================================================================
+# BITMAPS (n bits each)
+# =============================================================================
+
+def _bits_set(bitmap: bytearray, n: int, invert: bool = False) -> list:
+    """Positions 1..n whose bit is set (or clear, with invert=True)."""
+    found = []
+    # The regex engine skips the all-clear (or all-set) bytes in C
+    interesting = rb"[^\xff]" if invert else rb"[^\x00]"
+    for match in re.finditer(interesting, bitmap):
+        index = match.start()
+        byte = bitmap[index] ^ 0xFF if invert else bitmap[index]
+        while byte:
+            low = byte & -byte
+            value = index * 8 + low.bit_length() - 1
+            if 1 <= value <= n:
+                found.append(value)
+            byte ^= low
+    return found
+
+
+def _scan_python(chunks, n: int) -> tuple:
+    seen = bytearray(n // 8 + 1)
+    twice = bytearray(n // 8 + 1)
+    count = outside = 0
+    for chunk in chunks:
+        count += len(chunk)
+        for value in chunk:
+            if not 1 <= value <= n:
+                outside += 1
+                continue
+            index, mask = value >> 3, 1 << (value & 7)
+            if seen[index] & mask:
+                twice[index] |= mask
+            else:
+                seen[index] |= mask
+    return count, seen, twice, outside
+
+
+def _scan_numpy(chunks, n: int) -> tuple:
+    seen = np.zeros(n // 8 + 1, dtype=np.uint8)
+    twice = np.zeros(n // 8 + 1, dtype=np.uint8)
+    count = outside = 0
+    for chunk in chunks:
+        count += len(chunk)
+        values = np.sort(np.asarray(chunk, dtype=np.int64))
+        inside = (values >= 1) & (values <= n)
+        outside += int(values.size - inside.sum())
+        values = values[inside]
+        # Repeats inside this chunk, then values already seen in earlier chunks
+        same = values[1:] == values[:-1]
+        repeated = values[1:][same]
+        values = values[np.concatenate(([True], ~same))] if values.size else values
+        index, mask = values >> 3, (1 << (values & 7)).astype(np.uint8)
+        earlier = values[(seen[index] & mask) != 0]
+        for dup in (repeated, earlier):
+            np.bitwise_or.at(twice, dup >> 3, (1 << (dup & 7)).astype(np.uint8))
+        np.bitwise_or.at(seen, index, mask)
+    return count, bytearray(seen.tobytes()), bytearray(twice.tobytes()), outside
+
+
+def scan_bitmap(source=None, n: int = None, chunk_bytes: int = CHUNK_BYTES,
+                use_numpy: bool = None) -> ScanResult:
+    """
+    Every missing and every duplicated value of 1..n in one pass.
+
+    n is needed up front to size the bitmaps; without it the source must
+    be a path (read once more to find the largest value).
+    """
+    if n is None:
+        if not isinstance(source, str):
+            raise ValueError("scan_bitmap() needs n when reading a stream")
+        n = signature(read_chunks(source, chunk_bytes)).high or 0
+    use_numpy = np is not None if use_numpy is None else use_numpy
+    chunks = read_chunks(source, chunk_bytes, as_array=use_numpy)
+    scan = _scan_numpy if use_numpy else _scan_python
+    count, seen, twice, outside = scan(chunks, n)
+    return ScanResult(count, _bits_set(seen, n, invert=True), _bits_set(twice, n), outside)
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Find missing/duplicated numbers of 1..n.")
+    parser.add_argument("path", nargs="?", help="file of integers (default: stdin)")
+    parser.add_argument("--n", type=int, help="last number of the full series")
+    parser.add_argument("--bitmap", action="store_true",
+                        help="report every missing and duplicated value")
+    parser.add_argument("--duplicate", action="store_true",
+                        help="one number was replaced by a copy of another")
+    args = parser.parse_args()
+
+    if args.bitmap:
+        result = scan_bitmap(args.path, args.n)
+        print(f"numbers read: {result.count}")
+        print(f"missing ({len(result.missing)}):", *result.missing[:50])
+        print(f"duplicated ({len(result.duplicates)}):", *result.duplicates[:50])
+        if result.out_of_range:
+            print(f"outside 1..n: {result.out_of_range}")
+    elif args.duplicate:
+        missing, duplicate = missing_and_duplicate(read_chunks(args.path), args.n)
+        print(f"missing: {missing}  duplicated: {duplicate}")
+    else:
+        print(missing_one(read_chunks(args.path), args.n))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+=============================================================================
+PARALLEL N-QUEENS
+=============================================================================
+nqueens.py searches on one core.  The search tree splits cleanly: once
+the first rows are placed, the boards below them are independent
+subproblems.  This module cuts the tree at a fixed depth and hands the
+pieces to a multiprocessing pool.
+
+  * count_parallel(n)     - subproblems(n, depth) (mirror symmetry
+                            included) grouped into tasks; the counts are
+                            summed as they come back.
+  * solutions_parallel(n) - one task per valid placement of the first
+                            rows; each worker returns the solutions below
+                            its prefix.  ordered=True yields them in
+                            solutions() order, ordered=False as soon as a
+                            task finishes.
+
+Scheduling: the search below a prefix ranges from nothing (dead end) to
+a large share of the total, so the tree is cut into several times more
+tasks than workers (TASKS_PER_WORKER) and each idle worker takes the next
+task from the pool's shared queue.  A worker stuck on a big task never
+holds up the others, which is what work stealing buys, without a deque
+per worker.  `chunksize` sends several tasks per message for small n.
+
+    python nqueens_parallel.py                  # speedup table, n = 10..14
+    python nqueens_parallel.py --max-n 18 --workers 1 2 4 8
+=============================================================================
+"""
+
+import argparse
+import os
+import time
+from multiprocessing import Pool
+
+from nqueens import (NUMPY_MAX_N, NUMPY_MIN_N, _check, count_from, count_solutions,
+                     np, solutions, solutions_from, subproblems)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+TASKS_PER_WORKER = 8            # tasks queued per worker, for load balancing
+MAX_SPLIT_DEPTH = 3             # deepest row the tree is cut at
+
+
+def split_depth(n: int, workers: int) -> int:
+    """Shallowest cut that gives about TASKS_PER_WORKER tasks per worker."""
+    target = TASKS_PER_WORKER * workers
+    depth, count = 1, (n + 1) // 2
+    while count < target and depth < min(MAX_SPLIT_DEPTH, n - 1):
+        depth += 1
+        count = len(subproblems(n, depth))
+    return depth
+
+
+# =============================================================================
+# WORKERS (module level, so they can be pickled)
+# =============================================================================
+
+def _count_task(task) -> int:
+    n, states, row, use_numpy = task
+    return count_from(n, states, row, use_numpy)
+
+
+def _solutions_task(task) -> list:
+    n, prefix = task
+    return list(solutions_from(n, prefix))
+
+
+# =============================================================================
+# COUNTING
+# =============================================================================
+
+def count_parallel(n: int, workers: int = None, depth: int = None,
+                   use_numpy: bool = None, chunksize: int = 1) -> int:
+    """count_solutions(n) spread over `workers` processes (default: all cores)."""
+    _check(n)
+    workers = workers or os.cpu_count() or 1
+    if use_numpy is None:
+        use_numpy = np is not None and NUMPY_MIN_N <= n <= NUMPY_MAX_N
+    if workers == 1 or n < 4:
+        return count_solutions(n, use_numpy)
+    depth = depth or split_depth(n, workers)
+    states = subproblems(n, depth)
+    # Roughly TASKS_PER_WORKER tasks per worker, whatever the number of states
+    per_task = max(1, len(states) // (TASKS_PER_WORKER * workers))
+    tasks = [(n, states[i:i + per_task], depth, use_numpy)
+             for i in range(0, len(states), per_task)]
+    with Pool(workers) as pool:
+        return sum(pool.imap_unordered(_count_task, tasks, chunksize))
+
+
+# =============================================================================
+# ENUMERATION
+# =============================================================================
+
+def prefixes(n: int, depth: int) -> list:
+    """Every valid placement of the first `depth` rows, in solutions() order."""
+    full = (1 << n) - 1
+    found = []
+
+    def place(prefix, cols, ld, rd):
+        if len(prefix) == depth:
+            found.append(tuple(prefix))
+            return
+        avail = full & ~(cols | ld | rd)
+        while avail:
+            bit = avail & -avail
+            avail ^= bit
+            prefix.append(bit.bit_length() - 1)
+            place(prefix, cols | bit, ((ld | bit) << 1) & full, (rd | bit) >> 1)
+            prefix.pop()
+
+    place([], 0, 0, 0)
+    return found
+
+
+def solutions_parallel(n: int, workers: int = None, depth: int = None,
+                       ordered: bool = True, chunksize: int = 1):
+    """Yield every solution (column tuples), searched by `workers` processes."""
+    _check(n)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or n < 4:
+        yield from solutions(n)
+        return
+    depth = depth or min(2, n - 1)
+    tasks = [(n, prefix) for prefix in prefixes(n, depth)]
+    with Pool(workers) as pool:
+        results = pool.imap if ordered else pool.imap_unordered
+        for batch in results(_solutions_task, tasks, chunksize):
+            yield from batch
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def speedup_table(sizes, worker_counts, use_numpy: bool = None) -> list:
+    """Rows of (n, workers, count, seconds, speedup over the first worker count)."""
+    rows = []
+    for n in sizes:
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            count = count_parallel(n, workers, use_numpy=use_numpy)
+            seconds = time.perf_counter() - start
+            baseline = baseline or seconds
+            rows.append((n, workers, count, seconds, baseline / seconds))
+    return rows
+
+
+def main() -> None:
+    cores = os.cpu_count() or 1
+    default_workers = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+    parser = argparse.ArgumentParser(description="Parallel N-Queens speedup benchmark.")
+    parser.add_argument("--min-n", type=int, default=10)
+    parser.add_argument("--max-n", type=int, default=14,
+                        help="18 takes hours on a few cores")
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers)
+    parser.add_argument("--python", action="store_true", help="do not use NumPy")
+    args = parser.parse_args()
+
+    use_numpy = False if args.python else None
+    engine = "pure Python" if args.python or np is None else "NumPy"
+    print(f"N-Queens count, {engine}, {cores} core(s)")
+    print(f"{'n':>3} {'workers':>8} {'solutions':>12} {'seconds':>9} {'speedup':>8}")
+    for row in speedup_table(range(args.min_n, args.max_n + 1), args.workers, use_numpy):
+        n, workers, count, seconds, speedup = row
+        print(f"{n:>3} {workers:>8} {count:>12} {seconds:9.3f} {speedup:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+=============================================================================
+SERIES SUMS IN O(1)
+=============================================================================
+sum_natrl_nmbers() in Recursive_Functions.py adds 1..n with one recursive
+call per number; Jan_21.py already uses n*(n+1)//2 and the square-sum
+formula to find a missing number.  This module collects those closed
+forms, exact on Python ints:
+
+    natural_sum(n)          1 + 2 + ... + n              n(n+1)/2
+    square_sum(n)           1^2 + ... + n^2              n(n+1)(2n+1)/6
+    cube_sum(n)             1^3 + ... + n^3              (n(n+1)/2)^2
+    power_sum(n, p)         1^p + ... + n^p              Faulhaber, any p >= 0
+    arithmetic_sum(a, d, k) a + (a+d) + ... (k terms)    k(2a + (k-1)d)/2
+    geometric_sum(a, r, k)  a + ar + ... + ar^(k-1)      a(r^k - 1)/(r - 1)
+    range_sum(lo, hi, p)    lo^p + ... + hi^p            power_sum difference
+
+and, for sequences with no formula, PrefixSums: built once in O(n), then
+any sum(values[i:j]) is one subtraction.
+
+    natural_sum(10**9)              # instant; the recursion would need 10^9 frames
+    prefix = PrefixSums([3, 1, 4, 1, 5, 9, 2, 6])
+    prefix.range_sum(2, 5)          # 4 + 1 + 5 = 10
+=============================================================================
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+from itertools import accumulate
+from math import comb
+
+
+# =============================================================================
+# POWER SUMS
+# =============================================================================
+
+def natural_sum(n: int) -> int:
+    """1 + 2 + ... + n (0 for n <= 0)."""
+    return n * (n + 1) // 2 if n > 0 else 0
+
+
+def square_sum(n: int) -> int:
+    """1^2 + 2^2 + ... + n^2."""
+    return n * (n + 1) * (2 * n + 1) // 6 if n > 0 else 0
+
+
+def cube_sum(n: int) -> int:
+    """1^3 + 2^3 + ... + n^3."""
+    return natural_sum(n) ** 2
+
+
+@lru_cache(maxsize=None)
+def _bernoulli(p: int) -> tuple:
+    """B_0 .. B_p (with B_1 = +1/2, the convention Faulhaber's formula needs)."""
+    numbers = []
+    for m in range(p + 1):
+        # B_m = 1 - sum_{k<m} C(m, k) B_k / (m - k + 1)
+        value = Fraction(1)
+        for k, b in enumerate(numbers):
+            value -= comb(m, k) * b / (m - k + 1)
+        numbers.append(value)
+    return tuple(numbers)
+
+
+def power_sum(n: int, p: int) -> int:
+    """1^p + 2^p + ... + n^p for p >= 0, in O(p^2) independent of n."""
+    if p < 0:
+        raise ValueError("power_sum() needs p >= 0")
+    if n <= 0:
+        return 0
+    if p <= 3:
+        return (n, natural_sum(n), square_sum(n), cube_sum(n))[p]
+    # Faulhaber: sum = 1/(p+1) * sum_k C(p+1, k) B_k n^(p+1-k)
+    bernoulli = _bernoulli(p)
+    total = sum(comb(p + 1, k) * bernoulli[k] * n ** (p + 1 - k) for k in range(p + 1))
+    return int(total / (p + 1))
+
+
+def range_sum(low: int, high: int, p: int = 1) -> int:
+    """low^p + ... + high^p for 1 <= low (0 if high < low)."""
+    if low < 1:
+        raise ValueError("range_sum() needs low >= 1")
+    if high < low:
+        return 0
+    return power_sum(high, p) - power_sum(low - 1, p)
+
+
+# =============================================================================
+# ARITHMETIC AND GEOMETRIC SERIES
+# =============================================================================
+
+def arithmetic_sum(first, step, count: int):
+    """first + (first + step) + ... with `count` terms."""
+    if count <= 0:
+        return 0
+    total = count * (2 * first + (count - 1) * step)
+    return total // 2 if isinstance(total, int) else total / 2
+
+
+def geometric_sum(first, ratio, count: int):
+    """first + first*ratio + ... + first*ratio^(count-1)."""
+    if count <= 0:
+        return 0
+    if ratio == 1:
+        return first * count
+    if isinstance(first, int) and isinstance(ratio, int):
+        # Exact: (ratio^count - 1) is always divisible by (ratio - 1)
+        return first * ((ratio ** count - 1) // (ratio - 1))
+    return first * (ratio ** count - 1) / (ratio - 1)
+
+
+def geometric_sum_mod(first: int, ratio: int, count: int, modulus: int) -> int:
+    """geometric_sum(...) % modulus without building ratio^count."""
+    if count <= 0:
+        return 0
+    # (ratio^count - 1) / (ratio - 1) mod m, computed mod m*(ratio-1) so the
+    # division is exact; for ratio == 1 it is just count
+    if ratio == 1:
+        return first * count % modulus
+    big = modulus * abs(ratio - 1)
+    return first * ((pow(ratio, count, big) - 1) % big // (ratio - 1)) % modulus
+
+
+# =============================================================================
+# PREFIX SUMS
+# =============================================================================
+
+class PrefixSums:
+    """
+    prefix[i] = values[0] + ... + values[i-1], so the sum of values[i:j]
+    is prefix[j] - prefix[i].
+    """
+
+    def __init__(self, values):
+        self.prefix = [0]
+        self.prefix.extend(accumulate(values))
+
+    def __len__(self) -> int:
+        return len(self.prefix) - 1
+
+    def range_sum(self, start: int, stop: int):
+        """sum(values[start:stop]) with the same slice rules for start/stop."""
+        start, stop, _ = slice(start, stop).indices(len(self))
+        return self.prefix[stop] - self.prefix[start] if stop > start else 0
+
+    def total(self):
+        return self.prefix[-1]
+
+    def append(self, value) -> None:
+        self.prefix.append(self.prefix[-1] + value)
+
+    def range_sums(self, queries) -> list:
+        """range_sum() for each (start, stop) pair."""
+        return [self.range_sum(start, stop) for start, stop in queries]
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from trampoline import sum_natural
+
+    n = 1_000_000
+    start = time.perf_counter()
+    looped = sum_natural(n)
+    loop_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    closed = natural_sum(n)
+    closed_seconds = time.perf_counter() - start
+    print(f"1..{n}: recursion (trampolined) {loop_seconds:.3f}s, "
+          f"closed form {closed_seconds * 1e6:.1f}us, equal={looped == closed}")
+
+    # Jan_21.py: missing number / missing square
+    series = [1, 2, 3, 5, 6, 7, 8]
+    print("missing number:", natural_sum(len(series) + 1) - sum(series))
+    squares = [1, 4, 9, 16, 36, 49, 64]
+    print("missing square:", square_sum(len(squares) + 1) - sum(squares))
+
+    for p in range(8):
+        assert power_sum(50, p) == sum(i ** p for i in range(1, 51))
+    print("power_sum(10**12, 5) =", power_sum(10 ** 12, 5))
+    print("geometric_sum(1, 2, 64) =", geometric_sum(1, 2, 64))
+    print("geometric_sum_mod(3, 7, 10**18, 10**9 + 7) =",
+          geometric_sum_mod(3, 7, 10 ** 18, 10 ** 9 + 7))
+
+    values = [random.randint(-1000, 1000) for _ in range(1_000_000)]
+    queries = [tuple(sorted(random.sample(range(len(values) + 1), 2))) for _ in range(200)]
+    start = time.perf_counter()
+    naive = [sum(values[i:j]) for i, j in queries]
+    naive_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    prefix = PrefixSums(values)
+    build_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    fast = prefix.range_sums(queries)
+    query_seconds = time.perf_counter() - start
+    print(f"200 range sums over 10^6 values: slicing {naive_seconds:.3f}s, "
+          f"prefix build {build_seconds:.3f}s + queries {query_seconds * 1e3:.2f}ms, "
+          f"equal={naive == fast}")
@@ -0,0 +1,202 @@
+"""
+=============================================================================
+DEEP RECURSION WITHOUT THE C STACK
+=============================================================================
+Recursive_Functions.py raises sys.setrecursionlimit(150000) so that
+fn_1(5000) and sum_natrl_nmbers() can go deep.  The limit only stops
+Python from checking: each Python frame still sits on the C stack, and
+somewhere past a few tens of thousands of frames (it depends on the
+platform and thread stack size) the process dies with a segmentation
+fault instead of a RecursionError.
+
+Two ways to keep the recursive shape of the code without that risk:
+
+  * @trampoline for tail recursion (the recursive call is the last thing
+    the function does, usually with an accumulator).  Write the call as
+    `return f.tail(...)`: it returns a TailCall object instead of calling,
+    and the decorator keeps calling until a plain value comes back.
+    Constant stack, any depth; mutual recursion works the same way.
+
+        @trampoline
+        def factorial(n, acc=1):
+            if n == 0:
+                return acc
+            return factorial.tail(n - 1, acc * n)
+
+  * @stackless for any recursion (the result of the call is still needed
+    afterwards, as in a * fn_1(a - 1)).  Write the function as a generator
+    and `yield f.call(...)` where it used to call itself; the value of the
+    yield is the result.  A loop keeps the pending calls on a list
+    instead of the C stack, so depth is limited by memory only (about
+    250 bytes per pending call).
+
+        @stackless
+        def fn_1(a):
+            if a == 0:
+                return 1
+            return a * (yield fn_1.call(a - 1))
+
+Exceptions raised deep inside propagate to the callers' generators as
+usual, so try/except around a yield behaves like around a call.
+=============================================================================
+"""
+
+import types
+from functools import wraps
+
+
+# =============================================================================
+# TAIL CALLS
+# =============================================================================
+
+class TailCall:
+    """A call that has not been made yet."""
+
+    __slots__ = ("func", "args", "kwargs")
+
+    def __init__(self, func, args: tuple, kwargs: dict):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return f"TailCall({self.func.__name__}, {self.args!r}, {self.kwargs!r})"
+
+
+def trampoline(func):
+    """Run `func` and every TailCall it returns in a loop."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        result = func(*args, **kwargs)
+        while type(result) is TailCall:
+            result = result.func(*result.args, **result.kwargs)
+        return result
+
+    wrapper.tail = lambda *args, **kwargs: TailCall(func, args, kwargs)
+    return wrapper
+
+
+# =============================================================================
+# EXPLICIT STACK
+# =============================================================================
+
+def run(generator):
+    """
+    Drive a generator that yields sub-call generators.  Each one is run to
+    completion and its return value is sent back into the generator that
+    yielded it; the final return value is returned.
+    """
+    stack = [generator]
+    value = None
+    error = None
+    while stack:
+        top = stack[-1]
+        try:
+            if error is not None:
+                pending, error = error, None
+                call = top.throw(pending)
+            else:
+                call = top.send(value)
+        except StopIteration as stop:
+            stack.pop()
+            value = stop.value
+            continue
+        except BaseException as exc:
+            stack.pop()
+            if not stack:
+                raise
+            error = exc
+            continue
+        if type(call) is not types.GeneratorType:
+            stack.clear()
+            raise TypeError(f"a @stackless function yielded {call!r}; "
+                            f"yield f.call(...) for a recursive call")
+        stack.append(call)
+        value = None
+    return value
+
+
+def stackless(func):
+    """
+    Decorator for a generator function that yields `f.call(...)` where it
+    would recurse.  Calling the decorated function runs it to the end.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return run(func(*args, **kwargs))
+
+    wrapper.call = func
+    return wrapper
+
+
+# =============================================================================
+# THE EXAMPLES FROM Recursive_Functions.py
+# =============================================================================
+
+@trampoline
+def factorial(n: int, acc: int = 1) -> int:
+    """fn_1 with an accumulator."""
+    if n == 0:
+        return acc
+    return factorial.tail(n - 1, acc * n)
+
+
+@trampoline
+def sum_natural(n: int, acc: int = 0) -> int:
+    """sum_natrl_nmbers with an accumulator (sum of 1..n; 0 for n = 0)."""
+    if n <= 0:
+        return acc
+    return sum_natural.tail(n - 1, acc + n)
+
+
+@stackless
+def fn_1(a: int):
+    """fn_1 exactly as written in the notes, on an explicit stack."""
+    if a == 0:
+        return 1
+    return a * (yield fn_1.call(a - 1))
+
+
+@stackless
+def sum_natrl_nmbers(a: int):
+    if a <= 1:
+        return 1
+    return a + (yield sum_natrl_nmbers.call(a - 1))
+
+
+@trampoline
+def is_even(n: int) -> bool:
+    """Mutual tail recursion: is_even -> is_odd -> is_even ..."""
+    return True if n == 0 else is_odd.tail(n - 1)
+
+
+@trampoline
+def is_odd(n: int) -> bool:
+    return False if n == 0 else is_even.tail(n - 1)
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    def timed(label, function, *args):
+        start = time.perf_counter()
+        value = function(*args)
+        print(f"{label:34} {time.perf_counter() - start:7.3f}s")
+        return value
+
+    print("recursion limit:", sys.getrecursionlimit())
+    depth = 1_000_000
+    assert timed(f"sum_natural({depth}) trampoline", sum_natural, depth) == depth * (depth + 1) // 2
+    assert timed(f"sum_natrl_nmbers({depth}) stackless", sum_natrl_nmbers, depth) \
+        == depth * (depth + 1) // 2
+    assert timed("is_even(1000001) mutual", is_even, 1_000_001) is False
+    bits = timed("factorial(20000) trampoline", factorial, 20_000).bit_length()
+    assert bits == timed("fn_1(20000) stackless", fn_1, 20_000).bit_length()
+    print(f"20000! has {bits} bits")
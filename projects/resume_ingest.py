@@ -0,0 +1,174 @@
+"""
+================================================================================
+                    MEMORY-MAPPED TEXT RESUME INGESTION
+================================================================================
+Bulk screening path for .txt resumes that never builds a str copy of the
+file, let alone a lowercase one.
+
+  * Files of MMAP_THRESHOLD bytes or more are memory-mapped; smaller ones
+    are read once as bytes (mapping a tiny file costs more than reading it).
+  * ASCII skills and aliases (nearly all of them) are searched directly in
+    the bytes with a compiled bytes regex and re.IGNORECASE, which folds
+    ASCII case only.  UTF-8 never uses ASCII byte values inside multi-byte
+    characters, so this is exact for UTF-8 files.
+  * Non-ASCII skills ("análisis") fall back to decoding the file in
+    CHUNK_SIZE windows and searching each window with a Unicode
+    case-insensitive regex.  Only one window is alive at a time.
+
+For ASCII aliases the word boundaries follow skill_scoring.tokenize(), so
+results agree with the exact/alias part of SkillScorer.match().  Non-ASCII
+aliases do not: tokenize() only keeps ASCII letters and digits, so it
+splits "análisis" apart, while this path matches the whole word.  Fuzzy
+(typo) matching needs the tokenised text and is not done on this path.
+
+    python resume_ingest.py "python:3, sql, docker" dumps/*.txt
+================================================================================
+"""
+
+import mmap
+import os
+import re
+import sys
+from contextlib import contextmanager
+
+from resume_screener import parse_skills
+from skill_scoring import SkillScorer
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+MMAP_THRESHOLD = 1024 * 1024        # bytes
+CHUNK_SIZE = 4 * 1024 * 1024        # bytes decoded at a time on the Unicode path
+
+# A skill must not be glued to other token characters (see tokenize());
+# dots and slashes separate tokens, so "python.django" contains "python".
+BYTES_BEFORE = rb"(?<![A-Za-z0-9+#])"
+BYTES_AFTER = rb"(?![A-Za-z0-9+#])"
+TEXT_BEFORE = r"(?<![A-Za-z0-9+#])"
+TEXT_AFTER = r"(?![A-Za-z0-9+#])"
+
+
+# =============================================================================
+# FILE ACCESS
+# =============================================================================
+
+@contextmanager
+def open_resume_bytes(path: str):
+    """Yield the file's contents as a bytes-like object (mmap for big files)."""
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            yield file.read()
+            return
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mapped
+        finally:
+            mapped.close()
+
+
+def decoded_windows(data, chunk_size: int = CHUNK_SIZE, overlap: int = 0):
+    """
+    Decode UTF-8 data window by window without splitting a character.
+
+    Each window starts with the last `overlap` characters of the previous
+    one, so a match that straddles two windows is still seen whole.
+    """
+    start = 0
+    tail = ""
+    while start < len(data):
+        end = min(start + chunk_size, len(data))
+        # Step back over continuation bytes (10xxxxxx) to a character start
+        while end < len(data) and end > start and data[end] & 0xC0 == 0x80:
+            end -= 1
+        if end == start:
+            # No character starts in this window (invalid UTF-8): take the
+            # whole window and let errors="replace" deal with the bytes
+            end = min(start + chunk_size, len(data))
+        text = tail + data[start:end].decode("utf-8", errors="replace")
+        yield text
+        tail = text[-overlap:] if overlap else ""
+        start = end
+
+
+# =============================================================================
+# MATCHER
+# =============================================================================
+
+class MappedMatcher:
+    """Exact/alias skill matching over raw file bytes for one SkillScorer."""
+
+    def __init__(self, scorer: SkillScorer):
+        self.scorer = scorer
+        self.byte_patterns = {}     # skill -> compiled bytes regex (ASCII aliases)
+        self.text_patterns = {}     # skill -> compiled str regex (non-ASCII aliases)
+        self.longest_text_alias = 0
+
+        for skill, aliases in scorer.aliases.items():
+            ascii_aliases = [a for a in aliases if a.isascii() and a.strip()]
+            other_aliases = [a for a in aliases if not a.isascii() and a.strip()]
+            if ascii_aliases:
+                body = b"|".join(rb"\s+".join(re.escape(w.encode()) for w in a.split())
+                                 for a in ascii_aliases)
+                self.byte_patterns[skill] = re.compile(
+                    BYTES_BEFORE + b"(?:" + body + b")" + BYTES_AFTER, re.IGNORECASE)
+            if other_aliases:
+                body = "|".join(r"\s+".join(re.escape(w) for w in a.split())
+                                for a in other_aliases)
+                self.text_patterns[skill] = re.compile(
+                    TEXT_BEFORE + "(?:" + body + ")" + TEXT_AFTER, re.IGNORECASE)
+                self.longest_text_alias = max(self.longest_text_alias,
+                                              *(len(a) for a in other_aliases))
+
+    def match_bytes(self, data) -> dict:
+        """Return {skill: (matched text, 0)} like SkillScorer.match()."""
+        matched = {}
+        for skill, pattern in self.byte_patterns.items():
+            found = pattern.search(data)
+            if found:
+                matched[skill] = (found.group().decode("utf-8", errors="replace").lower(), 0)
+
+        pending = {s: p for s, p in self.text_patterns.items() if s not in matched}
+        if pending:
+            # Overlap must cover the longest alias plus the boundary character
+            overlap = self.longest_text_alias * 2 + 1
+            for text in decoded_windows(data, overlap=overlap):
+                for skill in list(pending):
+                    found = pending[skill].search(text)
+                    if found:
+                        matched[skill] = (found.group().lower(), 0)
+                        del pending[skill]
+                if not pending:
+                    break
+        return matched
+
+    def match_file(self, path: str) -> dict:
+        with open_resume_bytes(path) as data:
+            return self.match_bytes(data)
+
+    def score_file(self, path: str):
+        """Return the SkillScorer.ScoreResult for one text resume."""
+        return self.scorer.score_matches(self.match_file(path))
+
+
+def screen_text_files(paths, skills) -> list:
+    """Score many .txt resumes and return [(path, ScoreResult)] best first."""
+    matcher = MappedMatcher(SkillScorer(skills, max_distance=0))
+    results = [(path, matcher.score_file(path)) for path in paths]
+    results.sort(key=lambda item: item[1].score, reverse=True)
+    return results
+
+
+# =============================================================================
+# ENTRY POINT
+# =============================================================================
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print('Usage: python resume_ingest.py "skill1, skill2:weight" file1.txt [file2.txt ...]')
+        sys.exit(1)
+
+    for path, result in screen_text_files(sys.argv[2:], parse_skills(sys.argv[1])):
+        print(f"{result.score:6.2f}  {result.category:18}  {path}")
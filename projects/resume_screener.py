@@ -1,14 +1,15 @@
-import re
+import math
+
+from skill_scoring import SkillScorer, classify
 
 try:
     import pdfplumber
 except ImportError:
-    print("Error: pdfplumber is not installed. Install it using: pip install pdfplumber")
-    exit()
+    pdfplumber = None
 
-try:
-    # Step 1: Read resume file
-    file_name = input("Enter resume file name (.txt / .pdf): ")
+
+def read_resume(file_name):
+    """Return the raw text of a .txt or .pdf resume."""
     resume_data = ""
 
     # Handle TXT files
@@ -18,6 +19,8 @@ try:
 
     # Handle PDF files
     elif file_name.endswith(".pdf"):
+        if pdfplumber is None:
+            raise ImportError("pdfplumber is not installed. Install it using: pip install pdfplumber")
         with pdfplumber.open(file_name) as pdf:
             for page in pdf.pages:
                 text = page.extract_text()
@@ -25,54 +28,74 @@ try:
                     resume_data += text
 
     else:
-        print("Unsupported file format (Only .txt and .pdf allowed)")
-        exit()
-
-    # Convert to lowercase
-    resume_data = resume_data.lower()
-    print("\nResume loaded successfully!\n")
-
-    # Step 2: Take job skills input
-    skills_input = input("Enter required skills (comma separated): ").lower()
-    required_skills = [skill.strip() for skill in skills_input.split(",")]
-
-    total_skills = len(required_skills)
-    matched_skills = 0
-
-    print("\nChecking skills...\n")
-
-    # Step 3: Match skills using regex
-    for skill in required_skills:
-        pattern = r"\b" + re.escape(skill) + r"\b"
-
-        if re.search(pattern, resume_data):
-            print(f"{skill}  Found")
-            matched_skills += 1
-        else:
-            print(f"{skill}  Not Found")
-
-    # Step 4: Calculate score
-    if total_skills > 0:
-        score = (matched_skills / total_skills) * 100
-    else:
-        score = 0
-
-    print("\n-------------------------")
-    print(f"Matched Skills: {matched_skills}/{total_skills}")
-    print(f"Resume Score: {score:.2f}/100")
-
-    # Step 5: Classification
-    print("\nResult:")
-
-    if score > 90:
-        print("Priority Candidate")
-    elif score >= 70:
-        print("Shortlisted")
-    else:
-        print("Not Selected")
-
-except FileNotFoundError:
-    print("Error: Resume file not found. Please check file name.")
-
-except Exception as e:
-    print("Something went wrong:", e)
\ No newline at end of file
+        raise ValueError("Unsupported file format (Only .txt and .pdf allowed)")
+
+    return resume_data
+
+
+def parse_skills(skills_input):
+    """
+    Turn "python:3, sql:2, git" into {"python": 3.0, "sql": 2.0, "git": 1.0}.
+    Skills without an explicit ":weight" get weight 1.
+    """
+    required_skills = {}
+    for item in skills_input.lower().split(","):
+        skill, _, weight = item.partition(":")
+        skill = skill.strip()
+        if not skill:
+            continue
+        try:
+            value = float(weight) if weight.strip() else 1.0
+        except ValueError:
+            value = None
+        # nan/inf or a weight <= 0 would make the total meaningless
+        if value is None or not math.isfinite(value) or value <= 0:
+            raise ValueError(f"Invalid weight {weight.strip()!r} for skill "
+                             f"{skill!r} (expected a positive number, e.g. {skill}:2)")
+        required_skills[skill] = value
+    return required_skills
+
+
+def main():
+    try:
+        # Step 1: Read resume file
+        file_name = input("Enter resume file name (.txt / .pdf): ")
+        resume_data = read_resume(file_name)
+        print("\nResume loaded successfully!\n")
+
+        # Step 2: Take job skills input (optional weights: python:3, sql:2)
+        skills_input = input("Enter required skills (comma separated): ")
+        required_skills = parse_skills(skills_input)
+
+        print("\nChecking skills...\n")
+
+        # Step 3: Match skills (aliases such as js/javascript count)
+        scorer = SkillScorer(required_skills)
+        result = scorer.score(resume_data)
+
+        for skill in required_skills:
+            if skill in result.matched:
+                term, distance = result.matched[skill]
+                note = "" if term == skill else f" (as '{term}')"
+                print(f"{skill}  Found{note}")
+            else:
+                print(f"{skill}  Not Found")
+
+        # Step 4: Calculate score
+        print("\n-------------------------")
+        print(f"Matched Skills: {len(result.matched)}/{len(required_skills)}")
+        print(f"Resume Score: {result.score:.2f}/100")
+
+        # Step 5: Classification
+        print("\nResult:")
+        print(classify(result.score))
+
+    except FileNotFoundError:
+        print("Error: Resume file not found. Please check file name.")
+
+    except Exception as e:
+        print("Something went wrong:", e)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+================================================================================
+                    RESUME SCREENING SERVICE (Flask)
+================================================================================
+HTTP front end for resume_screener.py.
+
+    POST /screen              upload a resume, get a job id back at once
+                              form fields: resume=<file>, skills="python:3, sql"
+    GET  /jobs/<job_id>       poll the job (queued / running / done / failed)
+    GET  /jobs/<job_id>/stream   Server-Sent Events until the job finishes
+
+Extraction and scoring run in a bounded process pool, so a slow PDF never
+holds a web worker.  At most MAX_WORKERS + MAX_QUEUED jobs are in flight;
+beyond that POST /screen answers 503 with a Retry-After header instead of
+piling up uploads in memory.  Finished jobs are forgotten after JOB_TTL
+seconds.
+
+    python resume_service.py            # http://127.0.0.1:5000
+================================================================================
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from flask import Flask, Response, jsonify, request, url_for
+
+from resume_screener import parse_skills, read_resume
+from skill_scoring import SkillScorer
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+MAX_WORKERS = os.cpu_count() or 2
+MAX_QUEUED = 64                 # jobs waiting for a worker
+JOB_TTL = 15 * 60               # seconds a finished job stays pollable
+STREAM_INTERVAL = 0.5           # seconds between SSE status checks
+ALLOWED_EXTENSIONS = (".txt", ".pdf")
+
+
+# =============================================================================
+# WORKER SIDE (runs in the process pool)
+# =============================================================================
+
+def screen_file(path: str, skills: dict) -> dict:
+    """Extract and score one uploaded resume, then delete the upload."""
+    try:
+        started = time.perf_counter()
+        text = read_resume(path)
+        extracted = time.perf_counter()
+        result = SkillScorer(skills).score(text)
+        return {
+            "score": round(result.score, 2),
+            "category": result.category,
+            "matched": {skill: term for skill, (term, _) in result.matched.items()},
+            "missing": result.missing,
+            "extract_seconds": round(extracted - started, 4),
+            "score_seconds": round(time.perf_counter() - extracted, 4),
+        }
+    finally:
+        os.remove(path)
+
+
+# =============================================================================
+# JOB REGISTRY
+# =============================================================================
+
+class JobQueue:
+    """Tracks submitted jobs and caps how many may be in flight."""
+
+    def __init__(self, workers: int = MAX_WORKERS, queued: int = MAX_QUEUED):
+        self.workers = workers
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.pool_lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(workers + queued)
+        self.jobs = {}
+        self.futures = {}
+        self.lock = threading.Lock()
+
+    def submit(self, path: str, skills: dict):
+        """Queue a job and return its id, or None when the queue is full."""
+        if not self.slots.acquire(blocking=False):
+            return None
+        self._expire()
+        job_id = uuid.uuid4().hex
+        job = {"status": "queued", "submitted": time.time(), "finished": None,
+               "result": None, "error": None}
+        with self.lock:
+            self.jobs[job_id] = job
+
+        try:
+            future = self._pool_submit(path, skills)
+        except BaseException:
+            # The job never reached a worker: give back its slot and upload
+            self.slots.release()
+            with self.lock:
+                self.jobs.pop(job_id, None)
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+        with self.lock:
+            self.futures[job_id] = future
+        future.add_done_callback(lambda f: self._finish(job_id, f))
+        return job_id
+
+    def _pool_submit(self, path: str, skills: dict):
+        """Submit to the pool, replacing it once if a crashed worker broke it."""
+        with self.pool_lock:
+            pool = self.pool
+        try:
+            return pool.submit(screen_file, path, skills)
+        except BrokenProcessPool:
+            with self.pool_lock:
+                if self.pool is pool:
+                    self.pool = ProcessPoolExecutor(max_workers=self.workers)
+                    pool.shutdown(wait=False, cancel_futures=True)
+                pool = self.pool
+            return pool.submit(screen_file, path, skills)
+
+    def _finish(self, job_id: str, future) -> None:
+        self.slots.release()
+        with self.lock:
+            self.futures.pop(job_id, None)
+            job = self.jobs.get(job_id)
+            if job is None:
+                return
+            error = future.exception()
+            if error is None:
+                job["result"] = future.result()
+                job["status"] = "done"
+            else:
+                job["error"] = str(error)
+                job["status"] = "failed"
+            job["finished"] = time.time()
+
+    def _expire(self) -> None:
+        """Drop finished jobs older than JOB_TTL."""
+        cutoff = time.time() - JOB_TTL
+        with self.lock:
+            stale = [job_id for job_id, job in self.jobs.items()
+                     if job["finished"] is not None and job["finished"] < cutoff]
+            for job_id in stale:
+                del self.jobs[job_id]
+
+    def get(self, job_id: str):
+        """Return a snapshot of the job, or None if unknown."""
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            future = self.futures.get(job_id)
+            if job["status"] == "queued" and future is not None and future.running():
+                job["status"] = "running"
+            return dict(job, job_id=job_id)
+
+
+# =============================================================================
+# FLASK APP
+# =============================================================================
+
+app = Flask(__name__)
+app.config["MAX_CONTENT_LENGTH"] = 10 * 1024 * 1024   # 10 MB per upload
+jobs = None
+jobs_lock = threading.Lock()
+
+
+def get_jobs() -> JobQueue:
+    """Create the pool lazily so importing this module spawns no processes."""
+    global jobs
+    with jobs_lock:
+        if jobs is None:
+            jobs = JobQueue()
+    return jobs
+
+
+@app.route("/screen", methods=["POST"])
+def screen():
+    upload = request.files.get("resume")
+    try:
+        skills = parse_skills(request.form.get("skills", ""))
+    except ValueError as error:
+        return jsonify(error=str(error)), 400
+
+    if upload is None or not upload.filename:
+        return jsonify(error="Attach the resume as the 'resume' file field"), 400
+    extension = os.path.splitext(upload.filename)[1].lower()
+    if extension not in ALLOWED_EXTENSIONS:
+        return jsonify(error="Unsupported file format (Only .txt and .pdf allowed)"), 400
+    if not skills:
+        return jsonify(error="Send the required skills in the 'skills' field"), 400
+
+    handle, path = tempfile.mkstemp(suffix=extension, prefix="resume_")
+    with os.fdopen(handle, "wb") as file:
+        upload.save(file)
+
+    try:
+        job_id = get_jobs().submit(path, skills)
+    except (BrokenProcessPool, RuntimeError):
+        # submit() has already removed the upload
+        response = jsonify(error="Screening workers are restarting, try again shortly")
+        response.headers["Retry-After"] = "5"
+        return response, 503
+    if job_id is None:
+        os.remove(path)
+        response = jsonify(error="Screening queue is full, try again shortly")
+        response.headers["Retry-After"] = "5"
+        return response, 503
+
+    return jsonify(job_id=job_id,
+                   status_url=url_for("job_status", job_id=job_id),
+                   stream_url=url_for("job_stream", job_id=job_id)), 202
+
+
+@app.route("/jobs/<job_id>")
+def job_status(job_id):
+    job = get_jobs().get(job_id)
+    if job is None:
+        return jsonify(error="Unknown job id"), 404
+    return jsonify(job)
+
+
+@app.route("/jobs/<job_id>/stream")
+def job_stream(job_id):
+    if get_jobs().get(job_id) is None:
+        return jsonify(error="Unknown job id"), 404
+
+    def events():
+        last_status = None
+        while True:
+            job = get_jobs().get(job_id)
+            if job is None:
+                return
+            if job["status"] != last_status:
+                last_status = job["status"]
+                yield f"event: {last_status}\ndata: {json.dumps(job)}\n\n"
+            if last_status in ("done", "failed"):
+                return
+            time.sleep(STREAM_INTERVAL)
+
+    return Response(events(), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache"})
+
+
+# =============================================================================
+# RUN SERVER
+# =============================================================================
+
+if __name__ == "__main__":
+    app.run(debug=True, threaded=True, use_reloader=False)
@@ -0,0 +1,234 @@
+"""
+================================================================================
+                    RESUME SCREENING BENCHMARK
+================================================================================
+Generates a synthetic resume corpus and times the three stages of
+resume_screener.py separately:
+
+    extraction  - read_resume() on every .txt (and .pdf) file
+    matching    - SkillScorer.match() over the extracted text
+    scoring     - SkillScorer.score_matches() on the match results
+
+for every combination of corpus size and required-skill count, then writes
+a JSON report that can be diffed between runs.
+
+    python screening_benchmark.py --sizes 10,100,1000 --skills 5,20,100
+    python screening_benchmark.py --pdf --output report.json
+
+PDFs are written with a tiny built-in writer (no extra package needed);
+timing their extraction needs pdfplumber, otherwise the PDF stage is
+reported as skipped.
+================================================================================
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+
+from resume_screener import pdfplumber, read_resume
+from skill_scoring import SkillScorer
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+KNOWN_SKILLS = [
+    "python", "java", "javascript", "sql", "html", "css", "react", "django",
+    "flask", "docker", "kubernetes", "git", "linux", "excel", "tableau",
+    "machine learning", "deep learning", "pandas", "numpy", "aws",
+]
+
+FILLER_WORDS = (
+    "worked on team project delivered reports with clients managed the "
+    "development of internal tools and improved performance across modules "
+    "responsible for testing deployment documentation and code review"
+).split()
+
+LINES_PER_PDF_PAGE = 60
+WORDS_PER_LINE = 12
+
+
+# =============================================================================
+# SYNTHETIC CORPUS
+# =============================================================================
+
+def skill_vocabulary(count: int) -> list:
+    """Return `count` distinct skills: the real ones first, then synthetic."""
+    skills = KNOWN_SKILLS[:count]
+    skills += [f"skill{i}" for i in range(count - len(skills))]
+    return skills
+
+
+def make_resume(rng: random.Random, skills: list, words: int, density: float) -> str:
+    """Build one resume of `words` words containing about density * len(skills) skills."""
+    body = [rng.choice(FILLER_WORDS) for _ in range(words)]
+    for skill in skills:
+        if rng.random() < density:
+            body.insert(rng.randrange(len(body) + 1), skill)
+    lines = [" ".join(body[i:i + WORDS_PER_LINE]) for i in range(0, len(body), WORDS_PER_LINE)]
+    return "\n".join(lines)
+
+
+def write_pdf(path: str, text: str) -> None:
+    """Write text as a minimal multi-page PDF using the built-in Helvetica font."""
+    lines = text.splitlines() or [""]
+    pages = [lines[i:i + LINES_PER_PDF_PAGE] for i in range(0, len(lines), LINES_PER_PDF_PAGE)]
+
+    # Objects 1-3 are fixed; every page adds a page object and a content stream
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page_lines in pages:
+        escaped = [line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+                   for line in page_lines]
+        stream = "BT /F1 10 Tf 12 TL 50 780 Td\n" + "".join(f"({line}) '\n" for line in escaped) + "ET"
+        page_id = len(objects) + 1
+        kids.append(f"{page_id} 0 R")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>")
+        objects.append(f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode("latin-1")
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+
+    with open(path, "wb") as file:
+        file.write(out)
+
+
+def generate_corpus(directory: str, size: int, skills: list, words: int,
+                    density: float, pdf: bool = False, seed: int = 0) -> list:
+    """Write `size` resumes into directory and return their file names."""
+    rng = random.Random(seed)
+    paths = []
+    for i in range(size):
+        text = make_resume(rng, skills, words, density)
+        path = os.path.join(directory, f"resume_{i:06d}.txt")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text)
+        paths.append(path)
+        if pdf:
+            pdf_path = path[:-4] + ".pdf"
+            write_pdf(pdf_path, text)
+            paths.append(pdf_path)
+    return paths
+
+
+# =============================================================================
+# TIMING
+# =============================================================================
+
+def time_stage(func, items: list) -> tuple:
+    """Run func over items; return (results, elapsed seconds)."""
+    start = time.perf_counter()
+    results = [func(item) for item in items]
+    return results, time.perf_counter() - start
+
+
+def stage_report(elapsed: float, count: int) -> dict:
+    """Summarise one timed stage."""
+    return {
+        "seconds": round(elapsed, 6),
+        "per_resume_ms": round(elapsed / count * 1000, 4) if count else 0.0,
+        "resumes_per_second": round(count / elapsed, 1) if elapsed else None,
+    }
+
+
+def run_case(size: int, skill_count: int, words: int, density: float,
+             pdf: bool, seed: int) -> dict:
+    """Benchmark one (corpus size, skill count) combination."""
+    skills = skill_vocabulary(skill_count)
+    with tempfile.TemporaryDirectory() as directory:
+        paths = generate_corpus(directory, size, skills, words, density, pdf, seed)
+        txt_paths = [p for p in paths if p.endswith(".txt")]
+        pdf_paths = [p for p in paths if p.endswith(".pdf")]
+
+        texts, txt_seconds = time_stage(read_resume, txt_paths)
+        stages = {"extraction_txt": stage_report(txt_seconds, len(txt_paths))}
+
+        if pdf_paths and pdfplumber is not None:
+            _, pdf_seconds = time_stage(read_resume, pdf_paths)
+            stages["extraction_pdf"] = stage_report(pdf_seconds, len(pdf_paths))
+        elif pdf_paths:
+            stages["extraction_pdf"] = {"skipped": "pdfplumber is not installed"}
+
+    start = time.perf_counter()
+    scorer = SkillScorer(skills)
+    setup_seconds = time.perf_counter() - start
+
+    matches, match_seconds = time_stage(scorer.match, texts)
+    results, score_seconds = time_stage(scorer.score_matches, matches)
+
+    stages["scorer_setup"] = {"seconds": round(setup_seconds, 6)}
+    stages["matching"] = stage_report(match_seconds, size)
+    stages["scoring"] = stage_report(score_seconds, size)
+
+    return {
+        "corpus_size": size,
+        "skill_count": skill_count,
+        "words_per_resume": words,
+        "skill_density": density,
+        "mean_score": round(sum(r.score for r in results) / size, 4) if size else 0.0,
+        "stages": stages,
+    }
+
+
+def run_benchmark(sizes: list, skill_counts: list, words: int = 400,
+                  density: float = 0.5, pdf: bool = False, seed: int = 0) -> dict:
+    """Run every (size, skill count) case and return the full report."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "cases": [run_case(size, count, words, density, pdf, seed)
+                  for size in sizes for count in skill_counts],
+    }
+
+
+# =============================================================================
+# ENTRY POINT
+# =============================================================================
+
+def parse_int_list(value: str) -> list:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the resume screening pipeline.")
+    parser.add_argument("--sizes", type=parse_int_list, default=[10, 100, 1000],
+                        help="comma separated corpus sizes")
+    parser.add_argument("--skills", type=parse_int_list, default=[5, 20, 100],
+                        help="comma separated required-skill counts")
+    parser.add_argument("--words", type=int, default=400, help="words per resume")
+    parser.add_argument("--density", type=float, default=0.5,
+                        help="chance that each required skill appears in a resume")
+    parser.add_argument("--pdf", action="store_true", help="also generate and time PDF resumes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.sizes, args.skills, args.words, args.density, args.pdf, args.seed)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+        print(f"Report written to {args.output}")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
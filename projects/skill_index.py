@@ -0,0 +1,172 @@
+"""
+================================================================================
+                    INCREMENTAL SKILL INDEX - Resume Screening
+================================================================================
+Keeps, for every skill ever asked for, a bitset over all resumes (bit r
+set = resume r contains the skill).  When the recruiter edits the
+required-skills list only the skills never seen before are searched for;
+everything else is answered from the bitsets.
+
+    index = SkillIndex()
+    index.add_file("asha", "resumes/asha.txt")
+    index.rescore("python:3, sql, git")        # scans the corpus for 3 skills
+    index.rescore("python:3, sql, docker")     # scans only for "docker"
+
+Scoring is score = sum(weight * has_skill) over the required skills, for
+every resume at once.  With NumPy installed each required skill's bitset
+is unpacked into a 0/1 vector and the weighted sum is one matrix-vector
+product in C - about 10 ms for 20k resumes and 3 skills.  Without NumPy
+the weights are added in a Python loop over the set bits of each skill,
+so the cost is one Python step per (resume, matched skill) pair.
+
+Matching is exact/alias only (no typo tolerance) and goes through
+MappedMatcher: files are re-read from disk, in-memory text is kept as
+UTF-8 bytes.
+================================================================================
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from resume_ingest import MappedMatcher
+from resume_screener import parse_skills
+from skill_scoring import SkillScorer
+
+
+class SkillIndex:
+    """Per-skill resume bitsets with incremental skill discovery."""
+
+    def __init__(self, synonyms: dict = None):
+        self.synonyms = synonyms
+        self.columns = {}       # skill -> int bitset over resume rows
+        self.names = []         # resume names, in insertion order (= row)
+        self.sources = []       # ("file", path) or ("bytes", utf-8 text)
+        self._known = None      # matcher for every indexed skill, built on demand
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # -------------------------------------------------------------------------
+    # Adding resumes and skills
+    # -------------------------------------------------------------------------
+
+    def add_file(self, name: str, path: str) -> None:
+        """Index a .txt resume by path (the file is re-read only for new skills)."""
+        self._add(name, ("file", path))
+
+    def add_text(self, name: str, text: str) -> None:
+        """Index a resume whose text is already in memory (e.g. extracted from PDF)."""
+        self._add(name, ("bytes", text.encode("utf-8")))
+
+    def _add(self, name: str, source: tuple) -> None:
+        row = 1 << len(self.names)
+        if self.columns:
+            if self._known is None:
+                self._known = self._matcher(list(self.columns))
+            for skill in self._match(self._known, source):
+                self.columns[skill] |= row
+        self.names.append(name)
+        self.sources.append(source)
+
+    def _matcher(self, skills: list) -> MappedMatcher:
+        return MappedMatcher(SkillScorer(skills, self.synonyms, max_distance=0))
+
+    @staticmethod
+    def _match(matcher: MappedMatcher, source: tuple) -> dict:
+        kind, value = source
+        return matcher.match_file(value) if kind == "file" else matcher.match_bytes(value)
+
+    def learn(self, skills) -> list:
+        """Scan every resume for the skills not indexed yet; return those skills."""
+        new_skills = [skill for skill in skills if skill not in self.columns]
+        if not new_skills:
+            return []
+
+        # One matcher for the whole corpus; only the new skills are searched
+        self._known = None
+        matcher = self._matcher(new_skills)
+        found = dict.fromkeys(new_skills, 0)
+        for row, source in enumerate(self.sources):
+            for skill in self._match(matcher, source):
+                found[skill] |= 1 << row
+        self.columns.update(found)
+        return new_skills
+
+    # -------------------------------------------------------------------------
+    # Scoring
+    # -------------------------------------------------------------------------
+
+    def rescore(self, skills, top: int = None) -> list:
+        """
+        Score every resume against `skills` and return [(name, score)] best first.
+
+        Args:
+            skills: {skill: weight} dict or a "python:3, sql" string
+            top: keep only the best `top` resumes (None keeps all)
+        """
+        if isinstance(skills, str):
+            skills = parse_skills(skills)
+        else:
+            skills = {s.strip().lower(): float(w) for s, w in skills.items() if s.strip()}
+        self.learn(skills)
+
+        total_weight = sum(skills.values())
+        if total_weight <= 0:
+            return [(name, 0.0) for name in self.names][:top]
+
+        earned = (self._weighted_sums_numpy if np is not None else
+                  self._weighted_sums_python)(skills)
+        scale = 100 / total_weight
+        scores = [(name, value * scale) for name, value in zip(self.names, earned)]
+        scores.sort(key=lambda item: item[1], reverse=True)
+        return scores if top is None else scores[:top]
+
+    def _weighted_sums_numpy(self, skills: dict) -> list:
+        """sum(weight * has_skill) per resume as one matrix-vector product."""
+        count = len(self.names)
+        size = (count + 7) // 8
+        matrix = np.empty((len(skills), count), dtype=np.uint8)
+        for i, skill in enumerate(skills):
+            packed = np.frombuffer(self.columns[skill].to_bytes(size, "little"), np.uint8)
+            matrix[i] = np.unpackbits(packed, count=count, bitorder="little")
+        weights = np.fromiter(skills.values(), dtype=np.float64, count=len(skills))
+        return (weights @ matrix).tolist()
+
+    def _weighted_sums_python(self, skills: dict) -> list:
+        """The same sums, visiting only the resumes that have each skill."""
+        earned = [0.0] * len(self.names)
+        for skill, weight in skills.items():
+            column = self.columns[skill]
+            while column:
+                low = column & -column
+                earned[low.bit_length() - 1] += weight
+                column ^= low
+        return earned
+
+    def skills_of(self, name: str) -> list:
+        """Return the indexed skills found in the named resume."""
+        row = self.names.index(name)
+        return [skill for skill, column in self.columns.items() if column >> row & 1]
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    words = ["python", "java", "sql", "docker", "git", "excel", "react", "aws",
+             "team", "project", "delivered", "reports", "tools"]
+    rng = random.Random(0)
+    index = SkillIndex()
+    for i in range(20000):
+        index.add_text(f"candidate_{i}", " ".join(rng.choice(words) for _ in range(60)))
+
+    for skills in ("python:3, sql, git", "python:3, sql, docker", "python:3, sql:2, docker"):
+        start = time.perf_counter()
+        best = index.rescore(skills, top=3)
+        print(f"{skills:28} {time.perf_counter() - start:.3f}s  {best}")
@@ -0,0 +1,288 @@
+"""
+================================================================================
+                    SKILL SCORING ENGINE - Resume Screening
+================================================================================
+Weighted, alias-aware and typo-tolerant skill scoring for resume_screener.py.
+
+    score = sum(weight * credit for matched skills) / sum(all weights) * 100
+
+  * Each required skill carries a weight (default 1).
+  * Synonyms / aliases count as the skill itself ("js" -> "javascript").
+  * Optionally (max_distance > 0), single-word skills may also match with a
+    small edit distance ("pyhton" -> "python"); every edit removes
+    FUZZY_PENALTY of the credit.  It is off by default: at distance 1
+    everyday words already hit skills (reach -> react, scale -> scala,
+    flash -> flask, spare -> spark).
+
+Fuzzy matching uses a precomputed DELETE-VARIANT table (the SymSpell idea):
+every alias is stored under all strings obtained by deleting up to
+`max_distance` characters.  Two words within edit distance d always share
+such a variant, so a resume word only needs its own variants looked up in
+a dict - no scan over the whole skill vocabulary.  Candidates are then
+confirmed with a bounded Levenshtein check that gives up early.
+
+With all weights equal and no aliases the (default, exact) score is
+exactly the old matched_skills / total_skills * 100.
+================================================================================
+"""
+
+import heapq
+import re
+from dataclasses import dataclass, field
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+PRIORITY_CUTOFF = 90
+SHORTLIST_CUTOFF = 70
+FUZZY_PENALTY = 0.25        # credit lost per edit
+MIN_FUZZY_LENGTH = 5        # shorter words ("c", "sql", "aws") must match exactly
+
+# Letters, digits and the symbols used in names like c++ and c#.  Dots and
+# slashes separate tokens, as \b did in the old regex: "python.django" and
+# "python/django" both contain "python", and "node.js" is ("node", "js").
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+DEFAULT_SYNONYMS = {
+    "javascript": ["js", "ecmascript"],
+    "typescript": ["ts"],
+    "python": ["py", "python3"],
+    "machine learning": ["ml"],
+    "artificial intelligence": ["ai"],
+    "deep learning": ["dl"],
+    "natural language processing": ["nlp"],
+    "sql": ["mysql", "postgresql", "sqlite"],
+    "html": ["html5"],
+    "css": ["css3"],
+    "react": ["reactjs", "react.js"],
+    "node": ["nodejs", "node.js"],
+    "c++": ["cpp"],
+    "amazon web services": ["aws"],
+}
+
+
+# =============================================================================
+# TEXT HELPERS
+# =============================================================================
+
+def tokenize(text: str) -> list:
+    """
+    Split lowercase text into skill-friendly tokens (keeps c++, c#).
+
+        tokenize("Python.Django, node.js") -> ["python", "django", "node", "js"]
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def delete_variants(word: str, max_distance: int) -> set:
+    """Return every string reachable from `word` by up to max_distance deletions."""
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for item in frontier:
+            for i in range(len(item)):
+                next_frontier.add(item[:i] + item[i + 1:])
+        variants |= next_frontier
+        frontier = next_frontier
+    return variants
+
+
+def bounded_levenshtein(a: str, b: str, limit: int) -> int:
+    """
+    Edit distance between a and b (adjacent swaps count as one edit), or
+    limit + 1 as soon as it must exceed limit.
+
+    Only a diagonal band of width 2*limit+1 is filled, so the cost is
+    O(len * limit) instead of O(len * len).
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if a == b:
+        return 0
+
+    too_far = limit + 1
+    before_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        low = max(1, i - limit)
+        high = min(len(b), i + limit)
+        current = [too_far] * (len(b) + 1)
+        current[0] = i if i <= limit else too_far
+        row_best = current[0]
+        for j in range(low, high + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1,
+                             current[j - 1] + 1,
+                             previous[j - 1] + cost)
+            # Swapped neighbours ("pyhton") count as a single edit
+            if (i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]
+                    and before_previous[j - 2] + 1 < current[j]):
+                current[j] = before_previous[j - 2] + 1
+            if current[j] < row_best:
+                row_best = current[j]
+        if row_best > limit:
+            return too_far
+        before_previous, previous = previous, current
+    return min(previous[len(b)], too_far)
+
+
+# =============================================================================
+# SCORING ENGINE
+# =============================================================================
+
+@dataclass
+class ScoreResult:
+    """Outcome of scoring one resume."""
+    score: float
+    matched: dict = field(default_factory=dict)   # skill -> (matched term, distance)
+    missing: list = field(default_factory=list)
+
+    @property
+    def category(self) -> str:
+        return classify(self.score)
+
+
+def classify(score: float) -> str:
+    """Map a 0-100 score onto the screener's result categories."""
+    if score > PRIORITY_CUTOFF:
+        return "Priority Candidate"
+    elif score >= SHORTLIST_CUTOFF:
+        return "Shortlisted"
+    return "Not Selected"
+
+
+class SkillScorer:
+    """
+    Scores resume text against a weighted list of required skills.
+
+    Build one scorer per job opening and reuse it for every candidate: the
+    alias and variant tables are computed once in the constructor.
+    """
+
+    def __init__(self, skills, synonyms: dict = None, max_distance: int = 0,
+                 min_fuzzy_length: int = MIN_FUZZY_LENGTH):
+        """
+        Args:
+            skills: {skill: weight} dict, or a plain list of skills (weight 1)
+            synonyms: {skill: [aliases]}; defaults to DEFAULT_SYNONYMS
+            max_distance: largest edit distance accepted for a fuzzy match
+                (0, the default, matches skills and aliases exactly)
+            min_fuzzy_length: shortest alias that may match fuzzily
+        """
+        if not isinstance(skills, dict):
+            skills = {skill: 1.0 for skill in skills}
+        self.weights = {s.strip().lower(): float(w) for s, w in skills.items() if s.strip()}
+        self.total_weight = sum(self.weights.values())
+        self.max_distance = max_distance
+        self.min_fuzzy_length = min_fuzzy_length
+
+        if synonyms is None:
+            synonyms = DEFAULT_SYNONYMS
+        synonyms = {k.lower(): [a.lower() for a in v] for k, v in synonyms.items()}
+
+        # skill -> every spelling that counts for it
+        self.aliases = {skill: [skill] + synonyms.get(skill, []) for skill in self.weights}
+
+        # term (tuple of tokens) -> skills it stands for
+        self.terms = {}
+        self.longest_term = 1
+        for skill, aliases in self.aliases.items():
+            for alias in aliases:
+                term = tuple(tokenize(alias))
+                if not term:
+                    continue
+                self.terms.setdefault(term, set()).add(skill)
+                self.longest_term = max(self.longest_term, len(term))
+
+        # delete variant -> single-word aliases that produce it
+        self.variants = {}
+        if max_distance > 0:
+            for term in self.terms:
+                if len(term) == 1 and len(term[0]) >= min_fuzzy_length:
+                    for variant in delete_variants(term[0], max_distance):
+                        self.variants.setdefault(variant, set()).add(term[0])
+
+    def _fuzzy_lookup(self, word: str) -> dict:
+        """Return {alias: distance} for aliases within max_distance of word."""
+        found = {}
+        for variant in delete_variants(word, self.max_distance):
+            for alias in self.variants.get(variant, ()):
+                if alias not in found:
+                    distance = bounded_levenshtein(word, alias, self.max_distance)
+                    if distance <= self.max_distance:
+                        found[alias] = distance
+        return found
+
+    def match(self, text: str) -> dict:
+        """Return {skill: (matched term, distance)} for skills present in text."""
+        tokens = tokenize(text)
+        matched = {}
+
+        # Exact and alias matches: compare every n-gram up to the longest term
+        for size in range(1, self.longest_term + 1):
+            for i in range(len(tokens) - size + 1):
+                term = tuple(tokens[i:i + size])
+                for skill in self.terms.get(term, ()):
+                    matched[skill] = (" ".join(term), 0)
+
+        if not self.variants or len(matched) == len(self.weights):
+            return matched
+
+        # Fuzzy matches: each distinct resume word is looked up once
+        shortest = self.min_fuzzy_length - self.max_distance
+        for word in set(tokens):
+            if len(word) < shortest or (word,) in self.terms:
+                continue
+            for alias, distance in self._fuzzy_lookup(word).items():
+                for skill in self.terms[(alias,)]:
+                    if skill not in matched or matched[skill][1] > distance:
+                        matched[skill] = (word, distance)
+        return matched
+
+    def score(self, text: str) -> ScoreResult:
+        """Weighted 0-100 score of text against the required skills."""
+        return self.score_matches(self.match(text))
+
+    def score_matches(self, matched: dict) -> ScoreResult:
+        """Weighted 0-100 score from the output of match()."""
+        if self.total_weight <= 0:
+            return ScoreResult(0.0, matched, [])
+
+        earned = 0.0
+        for skill, (_, distance) in matched.items():
+            credit = max(0.0, 1.0 - FUZZY_PENALTY * distance)
+            earned += self.weights[skill] * credit
+        missing = [skill for skill in self.weights if skill not in matched]
+        return ScoreResult(earned / self.total_weight * 100, matched, missing)
+
+    def rank(self, resumes: dict, top: int = None) -> list:
+        """
+        Score many resumes and return [(name, ScoreResult)] best first.
+
+        Args:
+            resumes: {candidate name: resume text}
+            top: keep only the best `top` candidates (None keeps all)
+        """
+        scored = ((name, self.score(text)) for name, text in resumes.items())
+        if top is not None:
+            return heapq.nlargest(top, scored, key=lambda item: item[1].score)
+        return sorted(scored, key=lambda item: item[1].score, reverse=True)
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+if __name__ == "__main__":
+    scorer = SkillScorer({"python": 3, "javascript": 2, "sql": 2, "machine learning": 1},
+                         max_distance=1)
+    candidates = {
+        "Asha": "Built REST APIs in Python and MySQL; frontend in JS.",
+        "Ravi": "Pyhton scripting, some ML projects.",
+        "Kiran": "Java developer with Spring and Oracle.",
+    }
+    for name, result in scorer.rank(candidates):
+        print(f"{name:6} {result.score:6.2f}  {result.category:18} {result.matched}")